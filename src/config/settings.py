@@ -45,6 +45,10 @@ class DataProcessingSettings:
     fall_detection_mapping: Dict[str, int] = field(default_factory=lambda: {
         'No': 0, 'Yes': 1, 'FALSE': 0, 'TRUE': 1
     })
+    parquet_cache_directory: Optional[str] = "~/.cache/aar"  # None disables the cache
+    # Files of this size or larger are streamed in chunk_size-row chunks into per-soldier
+    # statistics instead of being loaded whole; None always loads the full frame
+    streaming_threshold_bytes: Optional[int] = 200 * 1024 * 1024
 
 
 @dataclass
@@ -223,7 +227,9 @@ class Settings:
                 'chunk_size': self.data_processing.chunk_size,
                 'required_columns': self.data_processing.required_columns,
                 'numeric_columns': self.data_processing.numeric_columns,
-                'fall_detection_mapping': self.data_processing.fall_detection_mapping
+                'fall_detection_mapping': self.data_processing.fall_detection_mapping,
+                'parquet_cache_directory': self.data_processing.parquet_cache_directory,
+                'streaming_threshold_bytes': self.data_processing.streaming_threshold_bytes
             },
             'reporting': {
                 'output_directory': self.reporting.output_directory,
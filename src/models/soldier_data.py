@@ -14,6 +14,7 @@ This module follows the refactored architecture principles:
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Union
 from enum import Enum
+import math
 import pandas as pd
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -405,6 +406,50 @@ class DatasetMetadata:
     exclusion_reasons: Dict[str, int] = field(default_factory=dict)
 
 
+@dataclass
+class RunningStatistics:
+    """
+    Mergeable summary of one metric: count, mean, variance, min, max and sum
+    
+    Batches are folded in with Chan's parallel form of Welford's update, so
+    the result does not depend on how the readings were split.
+    """
+    count: int = 0
+    mean: float = 0.0
+    sum_squared_deviations: float = 0.0
+    min_value: float = math.inf
+    max_value: float = -math.inf
+    total: float = 0.0
+    
+    def merge(self, count: int, mean: float, sum_squared_deviations: float,
+              min_value: float, max_value: float, total: float) -> None:
+        """Fold in the summary of another batch of readings"""
+        if count <= 0:
+            return
+        
+        combined = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / combined
+        self.sum_squared_deviations += sum_squared_deviations + delta * delta * self.count * count / combined
+        self.count = combined
+        self.min_value = min(self.min_value, min_value)
+        self.max_value = max(self.max_value, max_value)
+        self.total += total
+    
+    @property
+    def std_dev(self) -> float:
+        """Population standard deviation of the readings seen so far"""
+        return math.sqrt(self.sum_squared_deviations / self.count) if self.count else 0.0
+
+
+@dataclass
+class SoldierRunningStats:
+    """Per-soldier statistics accumulated while a large file is streamed"""
+    record_count: int = 0
+    metrics: Dict[str, RunningStatistics] = field(default_factory=dict)  # column -> statistics
+    heart_rate_zones: Dict[str, int] = field(default_factory=dict)  # zone name -> readings
+
+
 @dataclass
 class SoldierDataset:
     """Complete dataset containing all soldier data and metadata"""
@@ -433,6 +478,9 @@ class SoldierDataset:
     overall_data_quality: DataQualityLevel = DataQualityLevel.FAIR
     dataset_issues: List[str] = field(default_factory=list)
     
+    # Per-callsign statistics from a streamed load; raw_dataframe is then left empty
+    precomputed_statistics: Dict[str, SoldierRunningStats] = field(default_factory=dict)
+    
     def __post_init__(self):
         """Calculate derived metrics after initialization"""
         if not self.raw_dataframe.empty:
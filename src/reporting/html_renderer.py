@@ -4,15 +4,22 @@ Handles HTML template rendering and report formatting.
 Updated to integrate with the provided core services.
 """
 
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, TYPE_CHECKING
 from pathlib import Path
 from datetime import datetime
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import itertools
 import json
-from dataclasses import asdict
+import math
+import os
 
-# Template engine imports
-from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
-from jinja2.exceptions import TemplateError, TemplateNotFound
+# Jinja2 is imported on first use to keep module import cheap
+from markupsafe import Markup, escape
+
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
 
 # Updated imports to use provided core services
 from src.core.exceptions import ReportGenerationError, SoldierReportSystemError
@@ -22,6 +29,141 @@ from src.models.analysis_results import SoldierAnalysisResult, PerformanceScore,
 from src.models.report_config import ReportConfig, SectionType, MetricDisplayConfig
 
 
+# Bundled templates shipped alongside this module
+_TEMPLATE_DIRECTORY = Path(__file__).parent / "templates"
+
+# Minimum batch size before report rendering is spread across processes
+PARALLEL_RENDER_THRESHOLD = 8
+
+# Performance score band lower bounds and their colors (one more color than bounds)
+_PERFORMANCE_BINS = (60, 70, 80, 90)
+_PERFORMANCE_COLORS = (
+    "#c0392b",  # Dark red
+    "#e74c3c",  # Red
+    "#e67e22",  # Dark orange
+    "#f39c12",  # Orange
+    "#27ae60"   # Green
+)
+
+# Heart rate zone chart colors: rest, normal, elevated, high, extreme, critical
+_HR_ZONE_PALETTE = ('#2196f3', '#4caf50', '#ff9800', '#f44336', '#9c27b0', '#f44336')
+
+# Risk level colors, keyed by lowercased level name
+_RISK_COLORS = {
+    'low': '#27ae60',       # Green
+    'moderate': '#f39c12',  # Orange
+    'high': '#e74c3c',      # Red
+    'critical': '#c0392b'   # Dark red
+}
+
+
+def _format_metric_percentage(value: Any, decimal_places: int) -> str:
+    return f"{value:.{decimal_places}f}%"
+
+
+def _format_metric_number(value: Any, decimal_places: int) -> str:
+    if isinstance(value, (int, float)):
+        return f"{value:.{decimal_places}f}"
+    return str(value)
+
+
+def _format_metric_default(value: Any, decimal_places: int) -> str:
+    return str(value)
+
+
+# Metric value formatters keyed by MetricDisplayConfig.format_type
+_METRIC_FORMATTERS = {
+    'percentage': _format_metric_percentage,
+    'number': _format_metric_number,
+}
+
+
+def _create_template_environment(template_directory: Path) -> "Environment":
+    """
+    Create a Jinja2 environment with the report security settings.
+    
+    Templates in ``template_directory`` take precedence; the bundled templates
+    (e.g. ``charts/``) are searched after it.
+    """
+    from jinja2 import Environment, FileSystemLoader, select_autoescape
+    
+    search_path = [str(template_directory)]
+    if Path(template_directory).resolve() != _TEMPLATE_DIRECTORY.resolve():
+        search_path.append(str(_TEMPLATE_DIRECTORY))
+    
+    return Environment(
+        loader=FileSystemLoader(search_path),
+        autoescape=select_autoescape(['html', 'xml']),
+        trim_blocks=True,
+        lstrip_blocks=True
+    )
+
+
+_FAST_NUMBER_TYPES = (int, float)
+
+
+@lru_cache(maxsize=16)
+def _fixed_point_spec(decimal_places: int) -> str:
+    return f".{decimal_places}f"
+
+
+def _format_fixed(value: Any, decimal_places: int, suffix: str = "") -> str:
+    """Format a value to fixed decimal places; plain ints/floats skip float() coercion"""
+    if value is None:
+        return "N/A"
+    if type(value) not in _FAST_NUMBER_TYPES:
+        try:
+            value = float(value)
+        except (ValueError, TypeError):
+            return str(value)
+    try:
+        return format(value, _fixed_point_spec(decimal_places)) + suffix
+    except (ValueError, TypeError):
+        return str(value)
+
+
+def format_number(value: Union[int, float], decimal_places: int = 1) -> str:
+    """Format number with specified decimal places"""
+    return _format_fixed(value, decimal_places)
+
+
+def format_percentage(value: Union[int, float], decimal_places: int = 1) -> str:
+    """Format value as percentage"""
+    return _format_fixed(value, decimal_places, "%")
+
+
+def format_decimal(value: Union[int, float], places: int = 2) -> str:
+    """Format decimal with fixed places"""
+    return _format_fixed(value, places)
+
+
+@lru_cache(maxsize=1024)
+def _cached_strftime(dt: datetime, format_str: str) -> str:
+    """
+    Format a naive datetime, memoized on (dt, format_str) for repeated filter calls
+    
+    Aware datetimes must not go through here: equal instants in different zones
+    compare equal and would share one entry, showing the wrong local time and zone.
+    """
+    return dt.strftime(format_str)
+
+
+@lru_cache(maxsize=128)
+def _cached_performance_color(score: Union[int, float]) -> str:
+    """Resolve performance band color by bisecting the score band bounds"""
+    score = float(score)
+    if math.isnan(score):
+        # A missing score sorts past every bound; keep it in the lowest band
+        return _PERFORMANCE_COLORS[0]
+    return _PERFORMANCE_COLORS[bisect_right(_PERFORMANCE_BINS, score)]
+
+
+@lru_cache(maxsize=64)
+def _cached_risk_color(risk_level: str) -> str:
+    """Resolve risk level color; templates pass the same few levels repeatedly"""
+    return _RISK_COLORS.get(risk_level.lower(), '#95a5a6')
+
+
 class HTMLRenderer:
     """
     HTML report renderer using Jinja2 templates.
@@ -39,23 +181,19 @@ class HTMLRenderer:
         self.template_directory = template_directory
         self.event_bus = event_bus
         self.template_env = None
+        
+        # Component identifier for event sourcing
+        self.component_id = "HTMLRenderer"
+        
         self._setup_template_environment()
         
         # Register custom filters and functions
         self._register_template_filters()
-        
-        # Component identifier for event sourcing
-        self.component_id = "HTMLRenderer"
     
     def _setup_template_environment(self) -> None:
         """Setup Jinja2 template environment with security settings"""
         try:
-            self.template_env = Environment(
-                loader=FileSystemLoader(str(self.template_directory)),
-                autoescape=select_autoescape(['html', 'xml']),
-                trim_blocks=True,
-                lstrip_blocks=True
-            )
+            self.template_env = _create_template_environment(self.template_directory)
             
             self._publish_status("Template environment initialized")
             
@@ -71,9 +209,9 @@ class HTMLRenderer:
         
         try:
             # Number formatting filters
-            self.template_env.filters['format_number'] = self._format_number
-            self.template_env.filters['format_percentage'] = self._format_percentage
-            self.template_env.filters['format_decimal'] = self._format_decimal
+            self.template_env.filters['format_number'] = format_number
+            self.template_env.filters['format_percentage'] = format_percentage
+            self.template_env.filters['format_decimal'] = format_decimal
             
             # Status and color filters
             self.template_env.filters['performance_color'] = self._get_performance_color
@@ -136,6 +274,63 @@ class HTMLRenderer:
             self._publish_error(error, f"soldier_report_render_{analysis_result.callsign}")
             raise error
     
+    def render_soldier_reports(
+        self,
+        analysis_results: List[SoldierAnalysisResult],
+        config: ReportConfig,
+        template_name: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        parallel_threshold: int = PARALLEL_RENDER_THRESHOLD
+    ) -> List[str]:
+        """
+        Render soldier reports for a batch of analysis results.
+        
+        Batches of at least ``parallel_threshold`` results are rendered in a
+        process pool, each worker holding its own renderer; smaller batches
+        are rendered in-process.
+        
+        Args:
+            analysis_results: Analysis results to render
+            config: Report configuration shared by all reports
+            template_name: Optional template override
+            max_workers: Worker process count (defaults to CPU count)
+            parallel_threshold: Minimum batch size for process rendering
+            
+        Returns:
+            Rendered HTML strings, in the same order as ``analysis_results``
+            
+        Raises:
+            ReportGenerationError: If rendering fails
+        """
+        if len(analysis_results) < parallel_threshold:
+            return [
+                self.render_soldier_report(result, config, template_name)
+                for result in analysis_results
+            ]
+        
+        try:
+            self._publish_status(f"Rendering {len(analysis_results)} soldier reports in parallel")
+            
+            with ProcessPoolExecutor(
+                max_workers=max_workers or os.cpu_count(),
+                initializer=_init_render_worker,
+                initargs=(self.template_directory,)
+            ) as executor:
+                rendered = list(executor.map(
+                    _render_in_worker,
+                    analysis_results,
+                    itertools.repeat(config),
+                    itertools.repeat(template_name)
+                ))
+            
+            self._publish_status(f"Successfully rendered {len(rendered)} soldier reports")
+            return rendered
+            
+        except Exception as e:
+            error = ReportGenerationError(f"Failed to render soldier report batch: {e}")
+            self._publish_error(error, "soldier_report_batch_render")
+            raise error
+    
     def render_section(
         self,
         section_type: SectionType,
@@ -153,15 +348,14 @@ class HTMLRenderer:
         Returns:
             Rendered HTML section
         """
+        # Disabled or unconfigured sections render to nothing
+        section_config = config.get_section_by_type(section_type)
+        if not section_config or not section_config.enabled:
+            return ""
+        
         try:
             self._publish_status(f"Rendering section: {section_type.value}")
             
-            # Get section configuration
-            section_config = config.get_section_by_type(section_type)
-            if not section_config or not section_config.enabled:
-                self._publish_status(f"Section {section_type.value} disabled, skipping")
-                return ""
-            
             # Determine template name
             template_name = (section_config.template_override or 
                            f"sections/{section_type.value}.html")
@@ -198,7 +392,7 @@ class HTMLRenderer:
                 'performance_score': performance_score,
                 'rating': performance_score.performance_rating,
                 'status': performance_score.performance_status,
-                'breakdown': performance_score.__dict__,
+                'breakdown': performance_score,
                 'config': config
             }
             
@@ -251,11 +445,12 @@ class HTMLRenderer:
             template = self._load_template("components/metrics_grid.html")
             
             # Format metrics according to configuration
-            formatted_metrics = []
-            for metric_name, value in metrics.items():
-                metric_config = config.get_metric_config(metric_name)
-                formatted_metric = self._format_metric(metric_name, value, metric_config)
-                formatted_metrics.append(formatted_metric)
+            get_metric_config = config.get_metric_config
+            format_metric = self._format_metric
+            formatted_metrics = [
+                format_metric(metric_name, value, get_metric_config(metric_name))
+                for metric_name, value in metrics.items()
+            ]
             
             context = {
                 'metrics': formatted_metrics,
@@ -271,12 +466,12 @@ class HTMLRenderer:
             self._publish_error(error, "metrics_grid_render")
             raise error
     
-    def _load_template(self, template_name: str) -> Template:
+    def _load_template(self, template_name: str) -> "Template":
         """Load Jinja2 template with error handling"""
+        from jinja2.exceptions import TemplateError, TemplateNotFound
+        
         try:
-            template = self.template_env.get_template(template_name)
-            self._publish_status(f"Loaded template: {template_name}")
-            return template
+            return self.template_env.get_template(template_name)
             
         except TemplateNotFound:
             error = ReportGenerationError(f"Template not found: {template_name}")
@@ -334,25 +529,19 @@ class HTMLRenderer:
     def _prepare_heart_rate_chart_data(self, heart_rate_data: Dict[str, Any]) -> Dict[str, Any]:
         """Prepare heart rate data for chart visualization"""
         try:
-            chart_data = {}
-            
             # Heart rate zones data
-            if 'hr_zones' in heart_rate_data:
-                zones = heart_rate_data['hr_zones']
-                chart_data['zones'] = {
-                    'labels': list(zones.keys()),
-                    'data': list(zones.values()),
-                    'backgroundColor': [
-                        '#2196f3',  # rest
-                        '#4caf50',  # normal
-                        '#ff9800',  # elevated
-                        '#f44336',  # high
-                        '#9c27b0',  # extreme
-                        '#f44336'   # critical
-                    ]
-                }
+            zones = heart_rate_data.get('hr_zones')
+            if zones is None:
+                return {}
             
-            return chart_data
+            labels, values = zip(*zones.items()) if zones else ((), ())
+            return {
+                'zones': {
+                    'labels': labels,
+                    'data': values,
+                    'backgroundColor': _HR_ZONE_PALETTE
+                }
+            }
             
         except Exception as e:
             self._publish_error(
@@ -379,15 +568,8 @@ class HTMLRenderer:
                 }
             
             # Format value according to type
-            if config.format_type == 'percentage':
-                formatted_value = f"{value:.{config.decimal_places}f}%"
-            elif config.format_type == 'number':
-                if isinstance(value, (int, float)):
-                    formatted_value = f"{value:.{config.decimal_places}f}"
-                else:
-                    formatted_value = str(value)
-            else:
-                formatted_value = str(value)
+            formatter = _METRIC_FORMATTERS.get(config.format_type, _format_metric_default)
+            formatted_value = formatter(value, config.decimal_places)
             
             # Add unit if specified
             if config.unit:
@@ -430,68 +612,47 @@ class HTMLRenderer:
             event = ErrorEvent(error, context, self.component_id)
             self.event_bus.publish(event)
     
-    # Template filter functions (unchanged from previous version)
+    # Template filter functions
     def _format_number(self, value: Union[int, float], decimal_places: int = 1) -> str:
         """Format number with specified decimal places"""
-        if value is None:
-            return "N/A"
-        try:
-            return f"{float(value):.{decimal_places}f}"
-        except (ValueError, TypeError):
-            return str(value)
+        return format_number(value, decimal_places)
     
     def _format_percentage(self, value: Union[int, float], decimal_places: int = 1) -> str:
         """Format value as percentage"""
-        if value is None:
-            return "N/A"
-        try:
-            return f"{float(value):.{decimal_places}f}%"
-        except (ValueError, TypeError):
-            return str(value)
+        return format_percentage(value, decimal_places)
     
     def _format_decimal(self, value: Union[int, float], places: int = 2) -> str:
         """Format decimal with fixed places"""
-        return self._format_number(value, places)
+        return format_decimal(value, places)
     
     def _get_performance_color(self, score: Union[int, float]) -> str:
         """Get color class based on performance score"""
         try:
-            score = float(score)
-            if score >= 90:
-                return "#27ae60"  # Green
-            elif score >= 80:
-                return "#f39c12"  # Orange
-            elif score >= 70:
-                return "#e67e22"  # Dark orange
-            elif score >= 60:
-                return "#e74c3c"  # Red
-            else:
-                return "#c0392b"  # Dark red
+            return _cached_performance_color(score)
         except (ValueError, TypeError):
             return "#95a5a6"  # Gray for invalid values
     
     def _get_risk_color(self, risk_level: str) -> str:
         """Get color based on risk level"""
-        risk_colors = {
-            'low': '#27ae60',      # Green
-            'moderate': '#f39c12',  # Orange
-            'high': '#e74c3c',     # Red
-            'critical': '#c0392b'   # Dark red
-        }
-        return risk_colors.get(risk_level.lower(), '#95a5a6')
-    
-    def _get_status_badge(self, status: str) -> str:
+        return _cached_risk_color(risk_level)
+    
+    def _get_status_badge(self, status: str) -> Markup:
         """Get HTML badge for status"""
         color = self._get_risk_color(status)
-        return f'<span style="background-color: {color}; color: white; padding: 4px 8px; border-radius: 4px; font-weight: bold;">{status.upper()}</span>'
+        return Markup(
+            '<span style="background-color: {}; color: white; padding: 4px 8px; '
+            'border-radius: 4px; font-weight: bold;">{}</span>'
+        ).format(color, status.upper())
     
     def _format_datetime(self, dt: datetime, format_str: str = "%Y-%m-%d %H:%M:%S") -> str:
         """Format datetime object"""
         if not dt:
             return "N/A"
         try:
-            return dt.strftime(format_str)
-        except (AttributeError, ValueError):
+            if dt.tzinfo is not None:
+                return dt.strftime(format_str)
+            return _cached_strftime(dt, format_str)
+        except (AttributeError, ValueError, TypeError):
             return str(dt)
     
     def _format_duration(self, minutes: Optional[float]) -> str:
@@ -511,16 +672,41 @@ class HTMLRenderer:
         except (ValueError, TypeError):
             return "N/A"
     
-    def _to_chart_data(self, data: Dict[str, Any]) -> str:
+    def _to_chart_data(self, data: Dict[str, Any]) -> Markup:
         """Convert data to JSON for chart visualization"""
         return self._safe_json(data)
     
-    def _safe_json(self, data: Any) -> str:
-        """Safely convert data to JSON string"""
+    def _safe_json(self, data: Any) -> Markup:
+        """
+        Safely convert data to JSON for embedding in a <script> block.
+        
+        Closing-tag sequences are escaped so the result can be marked safe
+        and skip the template's autoescape pass.
+        """
         try:
-            return json.dumps(data, default=str, ensure_ascii=False)
+            json_str = json.dumps(data, default=str, ensure_ascii=False)
         except (TypeError, ValueError):
-            return "{}"
+            return Markup("{}")
+        return Markup(json_str.replace("</", "<\\/"))
+
+
+# Per-process renderer used by render_soldier_reports workers
+_worker_renderer: Optional[HTMLRenderer] = None
+
+
+def _init_render_worker(template_directory: Path) -> None:
+    """Build the renderer once per worker process"""
+    global _worker_renderer
+    _worker_renderer = HTMLRenderer(template_directory)
+
+
+def _render_in_worker(
+    analysis_result: SoldierAnalysisResult,
+    config: ReportConfig,
+    template_name: Optional[str]
+) -> str:
+    """Render a single soldier report in a worker process"""
+    return _worker_renderer.render_soldier_report(analysis_result, config, template_name)
 
 
 # Additional specialized renderers remain the same but with event integration
@@ -636,17 +822,41 @@ class ChartRenderer:
     Updated to integrate with event system.
     """
     
-    def __init__(self, chart_library: str = "plotly", event_bus: Optional[EventBus] = None):
+    def __init__(
+        self,
+        chart_library: str = "plotly",
+        event_bus: Optional[EventBus] = None,
+        html_renderer: Optional[HTMLRenderer] = None
+    ):
         """
         Initialize chart renderer.
         
         Args:
             chart_library: Chart library to use (plotly, chartjs, etc.)
             event_bus: Optional event bus for status updates
+            html_renderer: Optional HTML renderer whose template environment
+                is shared instead of building a standalone one
         """
         self.chart_library = chart_library
         self.event_bus = event_bus
         self.component_id = "ChartRenderer"
+        
+        # Sequential DOM ids for rendered charts
+        self._chart_id_counter = itertools.count()
+        
+        # Chart templates are compiled on first use, so a missing jinja2 or template
+        # file only sends that chart to its simple fallback
+        self.template_env = html_renderer.template_env if html_renderer is not None else None
+        self._chart_templates: Dict[str, "Template"] = {}
+    
+    def _chart_template(self, name: str) -> "Template":
+        """Load a bundled chart template once per renderer"""
+        template = self._chart_templates.get(name)
+        if template is None:
+            if self.template_env is None:
+                self.template_env = _create_template_environment(_TEMPLATE_DIRECTORY)
+            template = self._chart_templates[name] = self.template_env.get_template(f"charts/{name}")
+        return template
     
     def render_heart_rate_zones_chart(self, zones_data: Dict[str, int]) -> str:
         """Render heart rate zones pie chart"""
@@ -684,91 +894,51 @@ class ChartRenderer:
             self._publish_error(e, "performance_gauge")
             return self._render_simple_gauge(score, max_score)  # Fallback
     
-    # Chart rendering methods remain the same but with error handling
+    # Chart rendering methods
     def _render_plotly_pie_chart(self, data: Dict[str, int], title: str) -> str:
         """Render pie chart using Plotly"""
-        chart_id = f"chart_{hash(title)}"
-        return f"""
-        <div id="{chart_id}" style="width:100%;height:400px;"></div>
-        <script>
-            var data = [{
-                values: {list(data.values())},
-                labels: {list(data.keys())},
-                type: 'pie'
-            }];
-            var layout = {{title: '{title}'}};
-            Plotly.newPlot('{chart_id}', data, layout);
-        </script>
-        """
+        return self._chart_template("plotly_pie.html").render(
+            chart_id=f"chart_{next(self._chart_id_counter)}",
+            labels=list(data.keys()),
+            values=[float(value) for value in data.values()],
+            title=title
+        )
     
     def _render_chartjs_pie_chart(self, data: Dict[str, int], title: str) -> str:
         """Render pie chart using Chart.js"""
-        chart_id = f"chart_{hash(title)}"
-        return f"""
-        <canvas id="{chart_id}" width="400" height="400"></canvas>
-        <script>
-            var ctx = document.getElementById('{chart_id}').getContext('2d');
-            var chart = new Chart(ctx, {{
-                type: 'pie',
-                data: {{
-                    labels: {list(data.keys())},
-                    datasets: [{{
-                        data: {list(data.values())},
-                        backgroundColor: [
-                            '#FF6384', '#36A2EB', '#FFCE56', '#4BC0C0', '#9966FF', '#FF9F40'
-                        ]
-                    }}]
-                }},
-                options: {{
-                    responsive: true,
-                    title: {{
-                        display: true,
-                        text: '{title}'
-                    }}
-                }}
-            }});
-        </script>
-        """
+        return self._chart_template("chartjs_pie.html").render(
+            chart_id=f"chart_{next(self._chart_id_counter)}",
+            labels=list(data.keys()),
+            values=[float(value) for value in data.values()],
+            title=title
+        )
     
     def _render_simple_bar_chart(self, data: Dict[str, int]) -> str:
         """Render simple HTML/CSS bar chart"""
         if not data:
             return '<div class="no-chart">No chart data available</div>'
-            
-        max_value = max(data.values())
         
-        html = '<div class="simple-chart">'
-        for label, value in data.items():
-            width_percent = (value / max_value) * 100 if max_value > 0 else 0
-            html += f"""
-            <div class="chart-row">
-                <span class="chart-label">{label}</span>
-                <div class="chart-bar" style="width: {width_percent}%"></div>
-                <span class="chart-value">{value}</span>
-            </div>
-            """
-        html += '</div>'
+        max_value = max(data.values())
+        scale = (100.0 / max_value) if max_value > 0 else 0.0
         
-        return html
+        rows = "".join(
+            f'<div class="chart-row">'
+            f'<span class="chart-label">{escape(label)}</span>'
+            f'<div class="chart-bar" style="width: {value * scale:.2f}%"></div>'
+            f'<span class="chart-value">{escape(value)}</span>'
+            f'</div>'
+            for label, value in data.items()
+        )
+        return f'<div class="simple-chart">{rows}</div>'
     
     def _render_plotly_gauge(self, score: float, max_score: float) -> str:
         """Render gauge chart using Plotly"""
-        chart_id = f"gauge_{hash(str(score))}"
-        return f"""
-        <div id="{chart_id}" style="width:100%;height:400px;"></div>
-        <script>
-            var data = [{{
-                domain: {{ x: [0, 1], y: [0, 1] }},
-                value: {score},
-                title: {{ text: "Performance Score" }},
-                type: "indicator",
-                mode: "gauge+number",
-                gauge: {{ axis: {{ range: [null, {max_score}] }} }}
-            }}];
-            var layout = {{ width: 400, height: 400 }};
-            Plotly.newPlot('{chart_id}', data, layout);
-        </script>
-        """
+        # tojson cannot serialize NumPy scalars such as the scorers' np.int64 scores
+        return self._chart_template("plotly_gauge.html").render(
+            chart_id=f"gauge_{next(self._chart_id_counter)}",
+            score=float(score),
+            max_score=float(max_score)
+        )
     
     def _render_simple_gauge(self, score: float, max_score: float) -> str:
         """Render simple CSS-based gauge"""
@@ -1054,6 +1054,7 @@ class ReportGenerator:
         
         # Data storage - will be set when data is loaded
         self.data: Optional[pd.DataFrame] = None
+        self._callsign_positions: Optional[Dict[Any, np.ndarray]] = None
         self.battle_analyzer: Optional[BattleTimelineAnalyzer] = None
         self.safety_analyzer: Optional[SafetyAnalyzer] = None
         self.performance_scorer: Optional[PerformanceScorer] = None
@@ -1156,6 +1157,7 @@ class ReportGenerator:
                 
                 if dataframe is not None:
                     self.data = dataframe
+                    self._callsign_positions = None
                     print(f"DEBUG: Successfully extracted dataframe - shape: {self.data.shape}")
                     print(f"DEBUG: Available columns: {list(self.data.columns)}")
                     
@@ -1215,6 +1217,18 @@ class ReportGenerator:
                 return possible_cols[0]
         return None
     
+    def _get_soldier_rows(self, callsign_col: str, callsign: str) -> pd.DataFrame:
+        """Select one soldier's rows using row positions grouped once per dataset"""
+        if self._callsign_positions is None:
+            self._callsign_positions = self.data.groupby(
+                callsign_col, sort=False, observed=True
+            ).indices
+        
+        positions = self._callsign_positions.get(callsign)
+        if positions is None:
+            return self.data.iloc[0:0].copy()
+        return self.data.take(positions)
+    
     def _handle_analysis_completed(self, event) -> None:
         """Handle analysis completion event"""
         try:
@@ -1343,7 +1357,7 @@ class ReportGenerator:
         print(f"DEBUG: Unique callsigns in data: {self.data[callsign_col].unique()[:10]}")  # Show first 10
         
         # Filter data for the specific soldier
-        soldier_data = self.data[self.data[callsign_col] == callsign].copy()
+        soldier_data = self._get_soldier_rows(callsign_col, callsign)
         
         if len(soldier_data) == 0:
             # Try case-insensitive match
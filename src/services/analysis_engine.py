@@ -1,12 +1,17 @@
 """Analysis engine for soldier performance data"""
 
 import logging
-from typing import List, Dict, Any, Optional
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
+
 from src.core.event_bus import EventBus, Event
 from src.core.events import EventType
-from src.models.soldier_data import SoldierDataset, SoldierDataRecord
+from src.models.soldier_data import SoldierDataset, SoldierDataRecord, SoldierRunningStats, RunningStatistics
 from src.models.analysis_results import (
     SoldierAnalysisResult, BatchAnalysisResult, AnalysisStatus,
     HeartRateAnalysis, PhysicalPerformanceAnalysis, EquipmentAnalysis,
@@ -14,6 +19,16 @@ from src.models.analysis_results import (
 )
 from src.services.statistics_calculator import StatisticsCalculator
 
+# Row count from which the per-metric aggregations run concurrently
+PARALLEL_ANALYSIS_THRESHOLD = 500_000
+
+
+def _valid_values(series: pd.Series) -> np.ndarray:
+    """Return the non-null values of a numeric column as a float64 array"""
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    return values[~np.isnan(values)]
+
+
 class AnalysisEngine:
     """Engine for analyzing soldier performance data"""
     
@@ -27,6 +42,12 @@ class AnalysisEngine:
             EventType.ANALYSIS_STARTED.value,
             self._handle_analysis_request
         )
+        
+        # Remembered statistics belong to the previous dataset
+        self.event_bus.subscribe(
+            EventType.DATA_LOADED.value,
+            self._handle_data_loaded
+        )
     
     def _handle_analysis_request(self, event: Event):
         """Handle analysis request event"""
@@ -34,6 +55,10 @@ class AnalysisEngine:
         if dataset:
             self.analyze_dataset(dataset)
     
+    def _handle_data_loaded(self, event: Event):
+        """Handle data loaded event"""
+        self.stats_calculator.clear_cache()
+    
     def analyze_dataset(self, dataset: SoldierDataset) -> BatchAnalysisResult:
         """Analyze entire dataset"""
         self.logger.info("Starting batch analysis...")
@@ -44,24 +69,21 @@ class AnalysisEngine:
         )
         
         try:
-            # Get unique callsigns
-            if 'Callsign' in dataset.raw_dataframe.columns:
-                callsigns = dataset.raw_dataframe['Callsign'].unique()
+            if dataset.precomputed_statistics or 'Callsign' in dataset.raw_dataframe.columns:
+                if dataset.precomputed_statistics:
+                    # Streamed load: the loader already summarized every soldier
+                    soldier_results = self._analyze_precomputed_soldiers(dataset.precomputed_statistics)
+                else:
+                    soldier_results = self._analyze_all_soldiers(dataset.raw_dataframe)
                 
-                for callsign in callsigns:
-                    soldier_data = dataset.raw_dataframe[
-                        dataset.raw_dataframe['Callsign'] == callsign
-                    ]
-                    
-                    # Analyze individual soldier
-                    soldier_result = self.analyze_soldier(callsign, soldier_data)
+                for soldier_result in soldier_results:
                     batch_result.add_soldier_result(soldier_result)
                 
                 # Calculate aggregate statistics
                 batch_result.calculate_aggregate_statistics()
                 batch_result.analysis_status = AnalysisStatus.COMPLETED
                 
-                self.logger.info(f"Completed analysis for {len(callsigns)} soldiers")
+                self.logger.info(f"Completed analysis for {len(soldier_results)} soldiers")
             
             else:
                 self.logger.warning("No 'Callsign' column found in dataset")
@@ -82,20 +104,151 @@ class AnalysisEngine:
         
         return batch_result
     
-    def analyze_soldier(self, callsign: str, soldier_data: Any) -> SoldierAnalysisResult:
+    def _analyze_all_soldiers(self, data: pd.DataFrame) -> List[SoldierAnalysisResult]:
+        """
+        Analyze every soldier in the dataset.
+        
+        Produces the same results as calling analyze_soldier per callsign, but
+        computes each metric's statistics for all soldiers in one grouped
+        aggregation instead of one pass per soldier.
+        """
+        callsigns = data['Callsign']
+        record_counts = data.groupby('Callsign', sort=False, observed=True).size()
+        
+        # Metric aggregations are independent; pandas/NumPy reductions release
+        # the GIL for most of their work, so large batches use a thread each
+        if len(data) >= PARALLEL_ANALYSIS_THRESHOLD and (os.cpu_count() or 1) > 1:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                hr_future = executor.submit(self._aggregate_heart_rate, data, callsigns)
+                step_future = executor.submit(self._aggregate_steps, data, callsigns)
+                hr_summaries, hr_zones = hr_future.result()
+                step_summaries, step_totals = step_future.result()
+        else:
+            hr_summaries, hr_zones = self._aggregate_heart_rate(data, callsigns)
+            step_summaries, step_totals = self._aggregate_steps(data, callsigns)
+        
+        return self._build_soldier_results(record_counts.items(), hr_summaries, hr_zones,
+                                           step_summaries, step_totals)
+    
+    def _analyze_precomputed_soldiers(
+        self,
+        precomputed: Dict[str, SoldierRunningStats]
+    ) -> List[SoldierAnalysisResult]:
+        """
+        Analyze every soldier from statistics accumulated during a streamed load.
+        
+        Count, mean, standard deviation, min, max and totals are exact; medians
+        and quartiles cannot be derived from running statistics and are NaN.
+        """
+        hr_summaries, hr_zones, step_summaries, step_totals = {}, {}, {}, {}
+        for callsign, soldier_stats in precomputed.items():
+            hr_stats = soldier_stats.metrics.get('HR')
+            if hr_stats is not None:
+                hr_summaries[callsign] = self._running_summary(hr_stats)
+                hr_zones[callsign] = soldier_stats.heart_rate_zones
+            
+            step_stats = soldier_stats.metrics.get('Step_Count')
+            if step_stats is not None:
+                step_summaries[callsign] = self._running_summary(step_stats)
+                step_totals[callsign] = step_stats.total
+        
+        record_counts = ((callsign, soldier_stats.record_count) for callsign, soldier_stats in precomputed.items())
+        return self._build_soldier_results(record_counts, hr_summaries, hr_zones,
+                                           step_summaries, step_totals)
+    
+    @staticmethod
+    def _running_summary(stats: RunningStatistics) -> StatisticalSummary:
+        """Statistical summary of running statistics, without order statistics"""
+        return StatisticalSummary(
+            count=stats.count,
+            mean=stats.mean,
+            median=float('nan'),
+            std_dev=stats.std_dev,
+            min_value=stats.min_value,
+            max_value=stats.max_value,
+            percentile_25=float('nan'),
+            percentile_75=float('nan')
+        )
+    
+    def _build_soldier_results(self, record_counts, hr_summaries: Dict, hr_zones: Dict,
+                               step_summaries: Dict, step_totals) -> List[SoldierAnalysisResult]:
+        """Assemble per-soldier results from (callsign, record count) pairs and metric aggregates"""
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        results = []
+        for callsign, total_records in record_counts:
+            result = SoldierAnalysisResult(
+                callsign=callsign,
+                analysis_id=f"soldier_{callsign}_{timestamp}",
+                analysis_status=AnalysisStatus.IN_PROGRESS,
+                total_records=int(total_records)
+            )
+            
+            hr_stats = hr_summaries.get(callsign)
+            if hr_stats is not None:
+                result.heart_rate_analysis = HeartRateAnalysis(
+                    statistics=hr_stats,
+                    zones=hr_zones[callsign]
+                )
+            
+            step_stats = step_summaries.get(callsign)
+            if step_stats is not None:
+                result.physical_performance = PhysicalPerformanceAnalysis(
+                    step_statistics=step_stats,
+                    total_steps=int(step_totals[callsign]),
+                    activity_level="moderate"  # Could be calculated based on steps
+                )
+            
+            result.performance_score = self._basic_performance_score()
+            result.analysis_status = AnalysisStatus.COMPLETED
+            results.append(result)
+        
+        return results
+    
+    def _aggregate_heart_rate(self, data: pd.DataFrame, callsigns: pd.Series) -> Tuple[Dict, Dict]:
+        """Heart rate statistics and zone counts for every soldier"""
+        if 'HR' not in data.columns:
+            return {}, {}
+        
+        heart_rates = data['HR'].astype(np.float64)
+        hr_summaries = self.stats_calculator.calculate_grouped_summaries(
+            heart_rates.groupby(callsigns, sort=False, observed=True)
+        )
+        hr_zones = self.stats_calculator.calculate_grouped_heart_rate_zones(heart_rates, callsigns)
+        return hr_summaries, hr_zones
+    
+    def _aggregate_steps(self, data: pd.DataFrame, callsigns: pd.Series) -> Tuple[Dict, Any]:
+        """Step count statistics and totals for every soldier"""
+        if 'Step_Count' not in data.columns:
+            return {}, {}
+        
+        step_groups = data['Step_Count'].astype(np.float64).groupby(
+            callsigns, sort=False, observed=True
+        )
+        step_summaries = self.stats_calculator.calculate_grouped_summaries(step_groups)
+        return step_summaries, step_groups.sum()
+    
+    def _basic_performance_score(self) -> PerformanceScore:
+        """Create a basic performance score"""
+        return PerformanceScore(
+            final_score=85.0,  # Placeholder calculation
+            starting_score=100.0,
+            total_deductions=15.0
+        )
+    
+    def analyze_soldier(self, callsign: str, soldier_data: pd.DataFrame) -> SoldierAnalysisResult:
         """Analyze individual soldier data"""
         result = SoldierAnalysisResult(
             callsign=callsign,
             analysis_id=f"soldier_{callsign}_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
             analysis_status=AnalysisStatus.IN_PROGRESS,
-            total_records=len(soldier_data) if hasattr(soldier_data, '__len__') else 0
+            total_records=len(soldier_data)
         )
         
         try:
             # Analyze heart rate if available
-            if hasattr(soldier_data, 'columns') and 'HR' in soldier_data.columns:
-                hr_values = soldier_data['HR'].dropna().tolist()
-                if hr_values:
+            if 'HR' in soldier_data.columns:
+                hr_values = _valid_values(soldier_data['HR'])
+                if hr_values.size:
                     hr_stats = self.stats_calculator.calculate_summary(hr_values)
                     zones = self.stats_calculator.calculate_heart_rate_zones(hr_values)
                     
@@ -105,11 +258,11 @@ class AnalysisEngine:
                     )
             
             # Analyze physical performance
-            if hasattr(soldier_data, 'columns') and 'Step_Count' in soldier_data.columns:
-                step_values = soldier_data['Step_Count'].dropna().tolist()
-                if step_values:
+            if 'Step_Count' in soldier_data.columns:
+                step_values = _valid_values(soldier_data['Step_Count'])
+                if step_values.size:
                     step_stats = self.stats_calculator.calculate_summary(step_values)
-                    total_steps = sum(step_values)
+                    total_steps = int(step_values.sum())
                     
                     result.physical_performance = PhysicalPerformanceAnalysis(
                         step_statistics=step_stats,
@@ -118,11 +271,7 @@ class AnalysisEngine:
                     )
             
             # Create a basic performance score
-            result.performance_score = PerformanceScore(
-                final_score=85.0,  # Placeholder calculation
-                starting_score=100.0,
-                total_deductions=15.0
-            )
+            result.performance_score = self._basic_performance_score()
             
             result.analysis_status = AnalysisStatus.COMPLETED
             
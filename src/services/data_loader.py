@@ -1,16 +1,58 @@
 # File: src/services/data_loader.py
 """Data loading and validation service"""
 
+import hashlib
+import json
+import numpy as np
 import pandas as pd
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import logging
 
+try:
+    import pyarrow
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 from src.core.event_bus import EventBus, Event
 from src.core.events import EventType, DataLoadedEvent, ErrorEvent, StatusUpdateEvent
 from src.core.exceptions import DataLoadError, DataValidationError
-from src.models.soldier_data import SoldierDataset, DatasetMetadata
+from src.models.soldier_data import SoldierDataset, DatasetMetadata, SoldierRunningStats, RunningStatistics
 from src.config.settings import Settings
+from src.services.statistics_calculator import StatisticsCalculator
+
+# Number of fully built datasets kept in memory for repeat loads
+DATASET_CACHE_SIZE = 4
+
+# Bump whenever cleaning or dtype handling changes, so persisted Parquet
+# copies written by older code are no longer picked up
+PARQUET_CACHE_VERSION = 1
+
+# Standardized columns read by the analysis and reporting services; together
+# with the column mapping these are the only CSV columns that get parsed
+ANALYSIS_COLUMNS = frozenset({
+    'Callsign', 'Platoon', 'Squad', 'Time_Step', 'HR', 'Heart_Rate', 'Step_Count',
+    'Temperature', 'Battery', 'RSSI', 'Fall_Detection', 'Latitude', 'Longitude',
+    'Elevation', 'Posture', 'Casualty_State', 'Weapon', 'Shooter_Callsign'
+})
+
+# Numeric columns summarized per soldier when a large file is streamed, and the
+# heart rate column AnalysisEngine reads zones from
+STREAMED_METRIC_COLUMNS = ('HR', 'Heart_Rate', 'Step_Count', 'Temperature', 'Battery', 'RSSI')
+STREAMED_ZONE_COLUMN = 'HR'
+
+# Parse-time dtypes for standardized columns, so read_csv skips type inference
+READ_DTYPES = {
+    'Callsign': 'category',
+    'Heart_Rate': 'float32',
+    'Step_Count': 'float32',
+    'Temperature': 'float32',
+    'Battery': 'float32',
+    'RSSI': 'float32',
+    'Fall_Detection': 'category'
+}
 
 
 class DataLoader:
@@ -21,6 +63,9 @@ class DataLoader:
         self.settings = settings
         self.column_mapping = settings.column_mapping
         self._logger = logging.getLogger(__name__)
+        self._dataset_cache: OrderedDict[Tuple[str, int, int, str], SoldierDataset] = OrderedDict()
+        self._parquet_cache_dir = self._resolve_parquet_cache_dir(settings)
+        self._stats_calculator = StatisticsCalculator()
         
         # Subscribe to file selection events
         self.event_bus.subscribe(
@@ -38,6 +83,7 @@ class DataLoader:
                 source="DataLoader"
             ))
             
+            cache_hit = self.is_cached(file_path)
             dataset = self.load_data(file_path)
             
             self.event_bus.publish(DataLoadedEvent(
@@ -46,10 +92,12 @@ class DataLoader:
                 source="DataLoader"
             ))
             
-            self.event_bus.publish(StatusUpdateEvent(
-                f"Successfully loaded {len(dataset.raw_dataframe):,} records for {dataset.total_soldiers} soldiers",
+            status_event = StatusUpdateEvent(
+                f"Successfully loaded {dataset.metadata.total_processed_rows:,} records for {dataset.total_soldiers} soldiers",
                 source="DataLoader"
-            ))
+            )
+            status_event.metadata['cache_hit'] = cache_hit
+            self.event_bus.publish(status_event)
             
         except Exception as e:
             self._logger.error(f"Failed to load data from {file_path}: {e}")
@@ -63,6 +111,12 @@ class DataLoader:
         """
         Load and validate CSV data file
         
+        Files of at least data_processing.streaming_threshold_bytes are read in
+        chunks that are folded into per-soldier running statistics and then
+        dropped, so memory stays bounded by one chunk. The returned dataset
+        then carries precomputed_statistics and an empty raw_dataframe holding
+        only the column names.
+        
         Args:
             file_path: Path to CSV file
             
@@ -74,45 +128,44 @@ class DataLoader:
             DataValidationError: If data validation fails
         """
         try:
-            # Load CSV file
-            self._logger.info(f"Loading CSV file: {file_path}")
-            data = pd.read_csv(file_path)
-            
-            # Apply column mapping
-            mapped_data, mapping_applied = self._apply_column_mapping(data)
+            # Reuse the dataset built from an unchanged file
+            cache_key = self._cache_key(file_path)
+            cached_dataset = self._dataset_cache.get(cache_key)
+            if cached_dataset is not None:
+                self._dataset_cache.move_to_end(cache_key)
+                self._logger.info("Using cached dataset for: %s", file_path)
+                return cached_dataset
             
-            # Validate required columns
-            self._validate_required_columns(mapped_data)
+            dataset = self._load_parquet_cache(file_path, cache_key)
+            if dataset is None and self._should_stream(cache_key[2]):
+                dataset = self._stream_dataset(file_path, cache_key[2])
+            elif dataset is None:
+                # Load CSV file
+                self._logger.info("Loading CSV file: %s", file_path)
+                original_columns = self._read_header(file_path)
+                usecols = self._columns_to_load(original_columns)
+                data = self._read_csv(file_path, usecols=usecols, dtype=self._read_dtypes(usecols))
+                
+                # Apply column mapping
+                mapped_data, mapping_applied = self._apply_column_mapping(data)
+                
+                # Validate required columns
+                self._validate_required_columns(mapped_data)
+                
+                # Clean and transform data
+                cleaned_data = self._clean_data(mapped_data)
+                
+                dataset = self._build_dataset(
+                    file_path, cache_key[2], cleaned_data,
+                    column_mappings_applied=mapping_applied,
+                    original_column_names=original_columns,
+                    total_raw_rows=len(data)
+                )
+                self._write_parquet_cache(cache_key, dataset)
             
-            # Clean and transform data
-            cleaned_data = self._clean_data(mapped_data)
-            
-            # Create metadata
-            file_path_obj = Path(file_path)
-            metadata = DatasetMetadata(
-                file_path=file_path_obj,
-                original_filename=file_path_obj.name,
-                file_size_bytes=file_path_obj.stat().st_size if file_path_obj.exists() else 0,
-                column_mappings_applied=mapping_applied,
-                original_column_names=list(data.columns),
-                standardized_column_names=list(cleaned_data.columns),
-                total_raw_rows=len(data),
-                total_processed_rows=len(cleaned_data)
-            )
-            
-            # Create dataset with correct constructor arguments
-            dataset = SoldierDataset(
-                raw_dataframe=cleaned_data,
-                metadata=metadata
-            )
-            
-            # Validate data quality
-            quality_issues = self._validate_data_quality(dataset)
-            if hasattr(dataset, 'data_quality_issues'):
-                dataset.data_quality_issues = quality_issues
-            
-            if quality_issues:
-                self._logger.warning(f"Data quality issues found: {quality_issues}")
+            self._dataset_cache[cache_key] = dataset
+            if len(self._dataset_cache) > DATASET_CACHE_SIZE:
+                self._dataset_cache.popitem(last=False)
             
             return dataset
             
@@ -125,16 +178,306 @@ class DataLoader:
         except Exception as e:
             raise DataLoadError(f"Unexpected error loading data: {e}")
     
+    def _build_dataset(self, file_path: str, file_size: int, cleaned_data: pd.DataFrame,
+                       column_mappings_applied: Dict[str, str],
+                       original_column_names: List[str],
+                       total_raw_rows: int) -> SoldierDataset:
+        """Wrap cleaned data in a SoldierDataset and record its quality issues"""
+        # Create metadata
+        file_path_obj = Path(file_path)
+        metadata = DatasetMetadata(
+            file_path=file_path_obj,
+            original_filename=file_path_obj.name,
+            file_size_bytes=file_size,
+            column_mappings_applied=column_mappings_applied,
+            original_column_names=original_column_names,
+            standardized_column_names=list(cleaned_data.columns),
+            total_raw_rows=total_raw_rows,
+            total_processed_rows=len(cleaned_data)
+        )
+        
+        # Create dataset with correct constructor arguments
+        dataset = SoldierDataset(
+            raw_dataframe=cleaned_data,
+            metadata=metadata
+        )
+        
+        # Validate data quality
+        quality_issues = self._validate_data_quality(dataset)
+        if hasattr(dataset, 'data_quality_issues'):
+            dataset.data_quality_issues = quality_issues
+        
+        if quality_issues:
+            self._logger.warning("Data quality issues found: %s", quality_issues)
+        
+        return dataset
+    
+    def _should_stream(self, file_size: int) -> bool:
+        """Whether a file of this size is streamed into per-soldier statistics"""
+        processing_settings = getattr(self.settings, 'data_processing', None)
+        threshold = getattr(processing_settings, 'streaming_threshold_bytes', None)
+        return isinstance(threshold, int) and file_size >= threshold
+    
+    def _stream_chunk_rows(self) -> int:
+        """Rows per chunk for streamed loads"""
+        processing_settings = getattr(self.settings, 'data_processing', None)
+        chunk_rows = getattr(processing_settings, 'chunk_size', None)
+        return chunk_rows if isinstance(chunk_rows, int) and chunk_rows > 0 else 10000
+    
+    def _stream_dataset(self, file_path: str, file_size: int) -> SoldierDataset:
+        """Fold a large CSV file into per-soldier statistics without keeping its rows"""
+        self._logger.info("Streaming large CSV file in chunks: %s", file_path)
+        original_columns = self._read_header(file_path)
+        usecols = self._columns_to_load(original_columns)
+        mapping_applied = {
+            original_col: standard_col
+            for original_col, standard_col in self.column_mapping.items()
+            if original_col in (usecols or original_columns)
+        }
+        standard_columns = [mapping_applied.get(col, col) for col in usecols or original_columns]
+        self._validate_required_columns(pd.DataFrame(columns=standard_columns))
+        
+        dtype = self._read_dtypes(usecols)
+        if dtype:
+            try:
+                accumulators, total_rows = self._fold_csv_chunks(file_path, usecols, dtype, mapping_applied)
+            except ValueError as e:
+                self._logger.debug("Declared dtypes do not fit %s (%s), inferring types", file_path, e)
+                dtype = None
+        if not dtype:
+            accumulators, total_rows = self._fold_csv_chunks(file_path, usecols, None, mapping_applied)
+        
+        file_path_obj = Path(file_path)
+        metadata = DatasetMetadata(
+            file_path=file_path_obj,
+            original_filename=file_path_obj.name,
+            file_size_bytes=file_size,
+            column_mappings_applied=mapping_applied,
+            original_column_names=original_columns,
+            standardized_column_names=standard_columns,
+            total_raw_rows=total_rows,
+            total_processed_rows=total_rows
+        )
+        return SoldierDataset(
+            raw_dataframe=pd.DataFrame(columns=standard_columns),
+            metadata=metadata,
+            precomputed_statistics=accumulators
+        )
+    
+    def _fold_csv_chunks(self, file_path: str, usecols: Optional[List[str]],
+                         dtype: Optional[Dict[str, str]],
+                         mapping_applied: Dict[str, str]) -> Tuple[Dict[str, SoldierRunningStats], int]:
+        """Read a CSV file chunk by chunk, folding each chunk into per-callsign statistics"""
+        accumulators: Dict[str, SoldierRunningStats] = {}
+        total_rows = 0
+        for chunk in pd.read_csv(file_path, usecols=usecols, dtype=dtype,
+                                 chunksize=self._stream_chunk_rows()):
+            total_rows += len(chunk)
+            self._fold_chunk(accumulators, chunk.rename(columns=mapping_applied))
+        return accumulators, total_rows
+    
+    def _fold_chunk(self, accumulators: Dict[str, SoldierRunningStats], chunk: pd.DataFrame) -> None:
+        """Add one chunk's record counts, metric summaries and heart rate zones to the accumulators"""
+        callsigns = chunk['Callsign']
+        for callsign, count in chunk.groupby('Callsign', sort=False, observed=True).size().items():
+            accumulator = accumulators.get(callsign)
+            if accumulator is None:
+                accumulator = accumulators[callsign] = SoldierRunningStats()
+            accumulator.record_count += int(count)
+        
+        for column in STREAMED_METRIC_COLUMNS:
+            if column not in chunk.columns:
+                continue
+            
+            values = pd.to_numeric(chunk[column], errors='coerce').astype(np.float64)
+            groups = values.groupby(callsigns, sort=False, observed=True)
+            aggregated = groups.agg(['count', 'mean', 'min', 'max', 'sum'])
+            variance = groups.var(ddof=0).reindex(aggregated.index).to_numpy()
+            for callsign, count, mean, min_value, max_value, total, var in zip(
+                aggregated.index,
+                aggregated['count'].to_numpy(),
+                aggregated['mean'].to_numpy(),
+                aggregated['min'].to_numpy(),
+                aggregated['max'].to_numpy(),
+                aggregated['sum'].to_numpy(),
+                variance
+            ):
+                if count == 0:
+                    continue
+                metrics = accumulators[callsign].metrics
+                running = metrics.get(column)
+                if running is None:
+                    running = metrics[column] = RunningStatistics()
+                running.merge(int(count), float(mean), float(var) * count,
+                              float(min_value), float(max_value), float(total))
+            
+            if column == STREAMED_ZONE_COLUMN:
+                chunk_zones = self._stats_calculator.calculate_grouped_heart_rate_zones(values, callsigns)
+                for callsign, zones in chunk_zones.items():
+                    soldier_zones = accumulators[callsign].heart_rate_zones
+                    for zone, count in zones.items():
+                        soldier_zones[zone] = soldier_zones.get(zone, 0) + count
+    
+    def is_cached(self, file_path: str) -> bool:
+        """Check whether a load of file_path would be served from the cache"""
+        try:
+            return self._cache_key(file_path) in self._dataset_cache
+        except OSError:
+            return False
+    
+    def clear_cache(self) -> None:
+        """Drop all cached datasets"""
+        self._dataset_cache.clear()
+    
+    def _resolve_parquet_cache_dir(self, settings: Settings) -> Optional[Path]:
+        """Directory for persisted cleaned datasets, or None when disabled or pyarrow is missing"""
+        processing_settings = getattr(settings, 'data_processing', None)
+        directory = getattr(processing_settings, 'parquet_cache_directory', None)
+        if not PYARROW_AVAILABLE or not isinstance(directory, str) or not directory:
+            return None
+        return Path(directory).expanduser()
+    
+    def _parquet_cache_path(self, cache_key: Tuple[str, int, int, str]) -> Path:
+        """
+        Parquet file for a cache key; the name changes whenever the CSV does
+        
+        Names start with a digest of the CSV path alone, so every entry for a
+        file can be found (and pruned) without reading the sidecars.
+        """
+        digest = hashlib.sha256("|".join(map(str, cache_key)).encode('utf-8')).hexdigest()
+        return self._parquet_cache_dir / f"{self._parquet_cache_prefix(cache_key[0])}-{digest}.parquet"
+    
+    @staticmethod
+    def _parquet_cache_prefix(resolved_path: str) -> str:
+        """File name prefix shared by all Parquet cache entries of one CSV file"""
+        return hashlib.sha256(resolved_path.encode('utf-8')).hexdigest()[:16]
+    
+    def _prune_parquet_cache(self, cache_key: Tuple[str, int, int, str], keep: Path) -> None:
+        """Delete this CSV file's older Parquet entries, which can no longer be hit"""
+        for stale_path in self._parquet_cache_dir.glob(f"{self._parquet_cache_prefix(cache_key[0])}-*.parquet"):
+            if stale_path == keep:
+                continue
+            try:
+                stale_path.unlink(missing_ok=True)
+                stale_path.with_suffix('.json').unlink(missing_ok=True)
+            except OSError as e:
+                self._logger.warning(f"Could not remove stale Parquet cache {stale_path}: {e}")
+    
+    def _load_parquet_cache(self, file_path: str,
+                            cache_key: Tuple[str, int, int, str]) -> Optional[SoldierDataset]:
+        """Rebuild the dataset from a persisted Parquet copy of the cleaned data"""
+        if self._parquet_cache_dir is None:
+            return None
+        
+        parquet_path = self._parquet_cache_path(cache_key)
+        sidecar_path = parquet_path.with_suffix('.json')
+        if not (parquet_path.exists() and sidecar_path.exists()):
+            return None
+        
+        try:
+            cleaned_data = pd.read_parquet(parquet_path, engine='pyarrow')
+            load_metadata = json.loads(sidecar_path.read_text(encoding='utf-8'))
+        except Exception as e:
+            self._logger.warning(f"Ignoring unreadable Parquet cache {parquet_path}: {e}")
+            return None
+        
+        self._logger.info("Loaded cleaned data from Parquet cache: %s", parquet_path)
+        return self._build_dataset(file_path, cache_key[2], cleaned_data, **load_metadata)
+    
+    def _write_parquet_cache(self, cache_key: Tuple[str, int, int, str], dataset: SoldierDataset) -> None:
+        """Persist the cleaned data as Parquet, with the load metadata in a JSON sidecar"""
+        if self._parquet_cache_dir is None:
+            return
+        
+        parquet_path = self._parquet_cache_path(cache_key)
+        metadata = dataset.metadata
+        try:
+            self._parquet_cache_dir.mkdir(parents=True, exist_ok=True)
+            dataset.raw_dataframe.to_parquet(parquet_path, engine='pyarrow', compression='snappy')
+            parquet_path.with_suffix('.json').write_text(json.dumps({
+                'column_mappings_applied': metadata.column_mappings_applied,
+                'original_column_names': metadata.original_column_names,
+                'total_raw_rows': metadata.total_raw_rows
+            }), encoding='utf-8')
+        except Exception as e:
+            self._logger.warning(f"Could not write Parquet cache {parquet_path}: {e}")
+            return
+        
+        self._prune_parquet_cache(cache_key, parquet_path)
+    
+    def _cache_key(self, file_path: str) -> Tuple[str, int, int, str]:
+        """Build a cache key that changes whenever the file or the way it is loaded changes"""
+        path = Path(file_path).resolve()
+        stat = path.stat()
+        return (str(path), stat.st_mtime_ns, stat.st_size, self._load_signature())
+    
+    def _load_signature(self) -> str:
+        """Digest of the settings that shape the cleaned frame: mapping, parsed columns and dtypes"""
+        signature = json.dumps({
+            'version': PARQUET_CACHE_VERSION,
+            'column_mapping': sorted(self.column_mapping.items()),
+            'analysis_columns': sorted(ANALYSIS_COLUMNS),
+            'read_dtypes': sorted(READ_DTYPES.items())
+        })
+        return hashlib.sha256(signature.encode('utf-8')).hexdigest()
+    
+    def _read_header(self, file_path: str) -> List[str]:
+        """Read only the column names of a CSV file"""
+        try:
+            return list(pd.read_csv(file_path, nrows=0).columns)
+        except pd.errors.EmptyDataError:
+            # Leave it to the full read to report the file as empty
+            return []
+    
+    def _columns_to_load(self, header: List[str]) -> Optional[List[str]]:
+        """Select the header columns that are mapped or used downstream"""
+        if not header:
+            return None
+        
+        needed = set(self.column_mapping) | set(self.column_mapping.values()) | ANALYSIS_COLUMNS
+        return [col for col in header if col in needed]
+    
+    def _read_dtypes(self, columns: Optional[List[str]]) -> Dict[str, str]:
+        """Map raw column names to the parse-time dtype of their standardized column"""
+        dtypes = {}
+        for col in columns or []:
+            standard_col = self.column_mapping.get(col, col)
+            if standard_col in READ_DTYPES:
+                dtypes[col] = READ_DTYPES[standard_col]
+        return dtypes
+    
+    def _read_csv(self, file_path: str, usecols: Optional[List[str]] = None,
+                  dtype: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+        """Read CSV file with declared dtypes, inferring them if the data does not fit"""
+        if dtype:
+            try:
+                return self._parse_csv(file_path, usecols, dtype)
+            except ValueError as e:
+                self._logger.debug("Declared dtypes do not fit %s (%s), inferring types", file_path, e)
+        
+        return self._parse_csv(file_path, usecols)
+    
+    def _parse_csv(self, file_path: str, usecols: Optional[List[str]] = None,
+                   dtype: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+        """Parse CSV file, using the multithreaded pyarrow parser when available"""
+        if PYARROW_AVAILABLE:
+            try:
+                return pd.read_csv(file_path, engine='pyarrow', usecols=usecols, dtype=dtype)
+            except pyarrow.ArrowInvalid as e:
+                self._logger.debug("pyarrow could not parse %s (%s), using default parser", file_path, e)
+        
+        return pd.read_csv(file_path, usecols=usecols, dtype=dtype)
+    
     def _apply_column_mapping(self, data: pd.DataFrame) -> tuple[pd.DataFrame, Dict[str, str]]:
         """Apply column mapping to standardize column names"""
-        mapping_applied = {}
-        
-        for original_col, standard_col in self.column_mapping.items():
-            if original_col in data.columns:
-                data = data.rename(columns={original_col: standard_col})
-                mapping_applied[original_col] = standard_col
+        mapping_applied = {
+            original_col: standard_col
+            for original_col, standard_col in self.column_mapping.items()
+            if original_col in data.columns
+        }
+        data = data.rename(columns=mapping_applied)
         
-        self._logger.info(f"Applied column mapping: {mapping_applied}")
+        self._logger.info("Applied column mapping: %s", mapping_applied)
         return data, mapping_applied
     
     def _validate_required_columns(self, data: pd.DataFrame) -> None:
@@ -146,34 +489,49 @@ class DataLoader:
             raise DataValidationError(f"Missing required columns: {missing_columns}")
     
     def _clean_data(self, data: pd.DataFrame) -> pd.DataFrame:
-        """Clean and transform data"""
-        cleaned_data = data.copy()
+        """Clean and transform data in place (the frame passed in is modified and returned)"""
+        cleaned_data = data
         
-        # Convert Fall_Detection to numeric (No=0, Yes=1)
+        # Convert Fall_Detection to numeric (Yes=1, anything else=0)
         if 'Fall_Detection' in cleaned_data.columns:
-            cleaned_data['Fall_Detection'] = cleaned_data['Fall_Detection'].map({
-                'No': 0, 'Yes': 1
-            }).fillna(0)
+            cleaned_data['Fall_Detection'] = (
+                cleaned_data['Fall_Detection'].eq('Yes').to_numpy(dtype=np.int8)
+            )
         
         # Convert timestamps if possible
         if 'Time_Step' in cleaned_data.columns:
             try:
-                cleaned_data['Time_Step'] = pd.to_datetime(cleaned_data['Time_Step'])
-                start_time = cleaned_data['Time_Step'].min()
+                cleaned_data['Time_Step'] = self._parse_timestamps(cleaned_data['Time_Step'])
+                timestamps = cleaned_data['Time_Step'].to_numpy(dtype='datetime64[ns]')
                 cleaned_data['Time_Step_Numeric'] = (
-                    cleaned_data['Time_Step'] - start_time
-                ).dt.total_seconds() / 60
+                    timestamps - np.nanmin(timestamps)
+                ) / np.timedelta64(1, 'm')
             except Exception:
                 self._logger.warning("Could not convert time format, using original values")
         
-        # Clean numeric columns
+        # Clean numeric columns, storing them as float32 to halve their footprint
+        # (a no-op for columns already parsed with READ_DTYPES)
         numeric_columns = ['Heart_Rate', 'Step_Count', 'Temperature', 'Battery', 'RSSI']
         for col in numeric_columns:
             if col in cleaned_data.columns:
-                cleaned_data[col] = pd.to_numeric(cleaned_data[col], errors='coerce')
+                cleaned_data[col] = pd.to_numeric(cleaned_data[col], errors='coerce', downcast='float')
+        
+        # Group by integer category codes instead of hashing callsign strings
+        if 'Callsign' in cleaned_data.columns:
+            cleaned_data['Callsign'] = cleaned_data['Callsign'].astype('category')
         
         return cleaned_data
     
+    def _parse_timestamps(self, values: pd.Series) -> pd.Series:
+        """Parse timestamps with the vectorized ISO 8601 parser, falling back to per-element inference"""
+        for time_format in ('ISO8601', 'mixed'):
+            try:
+                return pd.to_datetime(values, format=time_format, cache=True)
+            except (ValueError, TypeError):
+                self._logger.debug("Time_Step values do not match format '%s'", time_format)
+        
+        return pd.to_datetime(values, cache=True)
+    
     def _validate_data_quality(self, dataset: SoldierDataset) -> List[str]:
         """Validate data quality and return list of issues"""
         issues = []
@@ -192,19 +550,38 @@ class DataLoader:
         
         # Check heart rate data quality
         if 'Heart_Rate' in data.columns:
-            hr_data = data['Heart_Rate'].dropna()
-            if len(hr_data) == 0:
+            hr_values = data['Heart_Rate'].to_numpy(dtype=np.float64, na_value=np.nan)
+            if np.isnan(hr_values).all():
                 issues.append("No valid heart rate data")
             else:
-                # Check for unrealistic values
-                extreme_hr = len(hr_data[(hr_data < 30) | (hr_data > 250)])
+                # Check for unrealistic values (NaN compares False on both sides)
+                extreme_hr = int(np.count_nonzero((hr_values < 30) | (hr_values > 250)))
                 if extreme_hr > 0:
                     issues.append(f"{extreme_hr} extreme heart rate values detected")
         
         # Check for duplicate records
         if 'Callsign' in data.columns and 'Time_Step' in data.columns:
-            duplicates = data.duplicated(subset=['Callsign', 'Time_Step']).sum()
+            duplicates = self._count_duplicate_records(data)
             if duplicates > 0:
                 issues.append(f"{duplicates} duplicate time records detected")
         
-        return issues
\ No newline at end of file
+        return issues
+    
+    def _count_duplicate_records(self, data: pd.DataFrame) -> int:
+        """Count rows repeating an earlier (Callsign, Time_Step) pair"""
+        callsigns = data['Callsign']
+        timestamps = data['Time_Step']
+        
+        # Pack category code and time offset into one int64 key and count distinct keys
+        if (isinstance(callsigns.dtype, pd.CategoricalDtype)
+                and pd.api.types.is_datetime64_any_dtype(timestamps)
+                and not timestamps.hasnans):
+            ticks = timestamps.to_numpy(dtype='datetime64[ns]').view(np.int64)
+            offsets = ticks - ticks.min()
+            span = int(offsets.max()) + 1
+            codes = callsigns.cat.codes.to_numpy().astype(np.int64) + 1
+            if span <= np.iinfo(np.int64).max // (len(callsigns.cat.categories) + 1):
+                keys = codes * span + offsets
+                return len(keys) - len(pd.unique(keys))
+        
+        return int(data.duplicated(subset=['Callsign', 'Time_Step']).sum())
\ No newline at end of file
@@ -6,9 +6,11 @@ Manages the lifecycle of all services in the event-driven architecture
 
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional, Protocol
+import sys
+from collections import defaultdict, deque
+from typing import Dict, List, Any, Optional, Protocol, Callable, Set, Tuple, Iterator
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
 import time
 
 # Event system imports
@@ -18,8 +20,18 @@ try:
 except ImportError:
     # Fallback for testing
     class EventBus:
-        def subscribe(self, event_type: str, handler): pass
-        def publish(self, event): pass
+        def __init__(self):
+            self._subs: Dict[str, List[Callable]] = defaultdict(list)
+            # Immutable snapshot per topic, rebuilt on subscribe, iterated on publish
+            self._subs_tuple_cache: Dict[str, Tuple[Callable, ...]] = {}
+        
+        def subscribe(self, event_type: str, handler):
+            self._subs[event_type].append(handler)
+            self._subs_tuple_cache[event_type] = tuple(self._subs[event_type])
+        
+        def publish(self, event):
+            for handler in self._subs_tuple_cache.get(event.type, ()):
+                handler(event)
     
     class Event:
         def __init__(self, type, data=None, source=None): 
@@ -28,24 +40,46 @@ except ImportError:
             self.source = source
 
 
-class ServiceStatus(Enum):
-    """Service status enumeration"""
-    STOPPED = "stopped"
-    STARTING = "starting"
-    RUNNING = "running"
-    STOPPING = "stopping"
-    ERROR = "error"
+# Operation name carried by service_error events raised during startup
+OPERATION_START = "start"
 
 
-@dataclass
+class ServiceStatus(IntEnum):
+    """Service status enumeration (integer-valued so comparisons stay cheap)"""
+    STOPPED = 0
+    STARTING = 1
+    RUNNING = 2
+    STOPPING = 3
+    ERROR = 4
+
+
+# Serialized status names used in status reports
+_STATUS_NAMES = {status: status.name.lower() for status in ServiceStatus}
+
+# Module-level aliases avoid the enum attribute lookup in per-service paths
+_STOPPED = ServiceStatus.STOPPED
+_STARTING = ServiceStatus.STARTING
+_RUNNING = ServiceStatus.RUNNING
+_STOPPING = ServiceStatus.STOPPING
+_ERROR = ServiceStatus.ERROR
+
+
+# ServiceInfo drops its per-instance __dict__ where dataclass slots are supported
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ServiceInfo:
     """Information about a registered service"""
     name: str
     instance: Any
     status: ServiceStatus
-    start_time: Optional[float] = None
+    start_time: Optional[float] = None  # Wall-clock start, for display
+    start_time_mono: Optional[float] = None  # perf_counter() at start, for uptime
     error_message: Optional[str] = None
     dependencies: Optional[List[str]] = None
+    has_internal_status: bool = False
+    reentrant: bool = False  # Can start again while its previous run is still stopping
 
 
 class ServiceProtocol(Protocol):
@@ -80,14 +114,61 @@ class ServiceManager:
         self.event_bus = event_bus
         self.logger = logging.getLogger(__name__)
         self._services: Dict[str, ServiceInfo] = {}
-        self._startup_order: List[str] = []
+        self._startup_order: Tuple[str, ...] = ()
+        self._startup_levels: Tuple[Tuple[str, ...], ...] = ()
+        
+        # Dependency graph maintained on (un)registration: service -> dependents,
+        # and service -> number of dependencies
+        self._reverse_deps: Dict[str, List[str]] = defaultdict(list)
+        self._in_degree: Dict[str, int] = {}
+        self._dep_sets: Dict[str, frozenset] = {}
+        
+        # Names of running / failed services in transition order (dicts as ordered sets)
+        self._running: Dict[str, None] = {}
+        self._failed: Dict[str, None] = {}
+        
+        # Background stop tasks started by unregister_service
+        self._pending_tasks: Set[asyncio.Task] = set()
+        
+        # Startup levels are recomputed only after the registry changes
+        self._levels_cache: Optional[Tuple[Tuple[str, ...], ...]] = None
+        self._order_dirty = True
         self._is_shutting_down = False
+        self._source = "ServiceManager"
         
         # Register event handlers
         self._register_event_handlers()
         
         self.logger.info("ServiceManager initialized")
     
+    @staticmethod
+    def configure_loop(loop: Optional[asyncio.AbstractEventLoop] = None) -> bool:
+        """
+        Opt the event loop into eager task execution (Python 3.12+)
+        
+        With eager tasks, a coroutine passed to create_task runs inline until its
+        first real suspension, so service stops that finish synchronously skip an
+        event-loop round trip.
+        
+        Args:
+            loop: Loop to configure; defaults to the running loop
+            
+        Returns:
+            True if the eager task factory was installed
+        """
+        eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_task_factory is None:
+            return False
+        
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return False
+        
+        loop.set_task_factory(eager_task_factory)
+        return True
+    
     def _register_event_handlers(self) -> None:
         """Register event handlers with the event bus"""
         self.event_bus.subscribe("service_started", self._handle_service_started)
@@ -95,7 +176,8 @@ class ServiceManager:
         self.event_bus.subscribe("service_error", self._handle_service_error)
     
     def register_service(self, name: str, service: ServiceProtocol, 
-                        dependencies: Optional[List[str]] = None) -> None:
+                        dependencies: Optional[List[str]] = None,
+                        reentrant: bool = False) -> None:
         """
         Register a service with the manager
         
@@ -103,38 +185,120 @@ class ServiceManager:
             name: Unique service name
             service: Service instance implementing ServiceProtocol
             dependencies: List of service names this service depends on
+            reentrant: Whether start_service() may run while stop_service() is
+                still in progress, allowing overlapped restarts
+            
+        Raises:
+            ValueError: If the name is taken or the dependencies would form a cycle
         """
         if name in self._services:
             raise ValueError(f"Service '{name}' is already registered")
         
+        cycle_dep = self._would_cycle(name, dependencies or [])
+        if cycle_dep is not None:
+            raise ValueError(
+                f"Circular dependency detected: '{name}' cannot depend on '{cycle_dep}'"
+            )
+        
         self._services[name] = ServiceInfo(
             name=name,
             instance=service,
-            status=ServiceStatus.STOPPED,
-            dependencies=dependencies or []
+            status=_STOPPED,
+            dependencies=dependencies or [],
+            has_internal_status=callable(getattr(service, "get_service_status", None)),
+            reentrant=reentrant
         )
         
-        self.logger.info(f"Registered service: {name}")
+        self._in_degree[name] = len(dependencies or [])
+        self._dep_sets[name] = frozenset(dependencies or [])
+        for dep in dependencies or []:
+            self._reverse_deps[dep].append(name)
+        self._order_dirty = True
+        
+        self.logger.info("Registered service: %s", name)
+    
+    def _would_cycle(self, name: str, dependencies: List[str]) -> Optional[str]:
+        """
+        Return the dependency that would close a cycle if name were registered
+        
+        The registered graph is kept acyclic, so a cycle can only pass through
+        the new service: one of its dependencies must already depend on it,
+        directly or transitively (services may declare not-yet-registered
+        dependencies). Walks the dependents of name breadth-first.
+        """
+        targets = set(dependencies)
+        if not targets:
+            return None
+        if name in targets:
+            return name
+        
+        seen = {name}
+        queue = deque([name])
+        while queue:
+            for dependent in self._reverse_deps.get(queue.popleft(), ()):
+                if dependent in targets:
+                    return dependent
+                if dependent not in seen:
+                    seen.add(dependent)
+                    queue.append(dependent)
+        return None
     
     def unregister_service(self, name: str) -> None:
         """
         Unregister a service
         
+        A running service is stopped in a background task and removed once the
+        stop completes; stop_all_services() waits for such pending stops. On a
+        loop configured with configure_loop() the task starts eagerly, so a
+        stop_service() that never suspends has completed by the time this
+        method returns.
+        
         Args:
             name: Service name to unregister
+            
+        Raises:
+            RuntimeError: If the service is running and no event loop is running
         """
-        if name not in self._services:
-            self.logger.warning(f"Service '{name}' not found for unregistration")
+        service_info = self._services.get(name)
+        if service_info is None:
+            self.logger.warning("Service '%s' not found for unregistration", name)
             return
         
-        service_info = self._services[name]
+        # Stop the service if it's running, keeping it registered until stopped
+        if service_info.status is _RUNNING:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                raise RuntimeError(
+                    f"Cannot unregister running service '{name}' outside an event loop; stop it first"
+                ) from None
+            
+            task = asyncio.create_task(self._stop_single_service(name))
+            self._pending_tasks.add(task)
+            task.add_done_callback(lambda done: self._finish_unregister(name, done))
+            return
         
-        # Stop the service if it's running
-        if service_info.status == ServiceStatus.RUNNING:
-            asyncio.create_task(self._stop_single_service(name))
+        self._remove_service(name)
+    
+    def _finish_unregister(self, name: str, task: asyncio.Task) -> None:
+        """Remove a service once its background stop task has finished"""
+        self._pending_tasks.discard(task)
+        self._remove_service(name)
+    
+    def _remove_service(self, name: str) -> None:
+        """Drop a service from the registry and the dependency graph"""
+        service_info = self._services.pop(name, None)
+        if service_info is None:
+            return
         
-        del self._services[name]
-        self.logger.info(f"Unregistered service: {name}")
+        for dep in service_info.dependencies or []:
+            self._reverse_deps[dep].remove(name)
+        del self._in_degree[name]
+        del self._dep_sets[name]
+        self._running.pop(name, None)
+        self._failed.pop(name, None)
+        self._order_dirty = True
+        self.logger.info("Unregistered service: %s", name)
     
     async def start_all_services(self) -> None:
         """Start all registered services in dependency order"""
@@ -144,210 +308,348 @@ class ServiceManager:
         
         self.logger.info("Starting all services...")
         
-        # Calculate startup order based on dependencies
-        startup_order = self._calculate_startup_order()
-        self._startup_order = startup_order
+        # Group services into dependency levels; services within a level are independent
+        startup_levels = self._get_startup_levels()
+        self._startup_levels = startup_levels
+        self._startup_order = tuple(name for level in startup_levels for name in level)
         
-        # Start services in order
-        for service_name in startup_order:
+        # Start each level concurrently, once the previous level is up
+        for level in startup_levels:
             if self._is_shutting_down:
                 self.logger.info("Startup interrupted by shutdown")
                 break
-                
-            await self._start_single_service(service_name)
+            
+            await asyncio.gather(
+                *(self._start_single_service(service_name) for service_name in level),
+                return_exceptions=True
+            )
         
         self.logger.info("All services startup completed")
         
         # Publish system ready event
-        running_services = [name for name, info in self._services.items() 
-                          if info.status == ServiceStatus.RUNNING]
-        
-        self.event_bus.publish(Event(
-            type="system_ready",
-            data={
-                "services_started": running_services,
-                "total_services": len(self._services)
-            },
-            source="ServiceManager"
-        ))
+        self._emit_system_ready(self.get_running_services(), len(self._services))
     
     async def stop_all_services(self) -> None:
         """Stop all services in reverse startup order"""
         self._is_shutting_down = True
         self.logger.info("Stopping all services...")
         
-        # Stop in reverse order
-        shutdown_order = list(reversed(self._startup_order)) if self._startup_order else list(self._services.keys())
+        # Stop in reverse level order, each level concurrently; without a recorded
+        # startup the dependency structure is unknown, so stop one at a time
+        if self._startup_levels:
+            shutdown_levels = reversed(self._startup_levels)
+        else:
+            shutdown_levels = [[service_name] for service_name in self._services]
+        
+        for level in shutdown_levels:
+            await asyncio.gather(
+                *(self._stop_single_service(service_name) for service_name in level),
+                return_exceptions=True
+            )
         
-        for service_name in shutdown_order:
-            await self._stop_single_service(service_name)
+        # Let stops started by unregister_service finish
+        if self._pending_tasks:
+            await asyncio.gather(*self._pending_tasks, return_exceptions=True)
         
         self.logger.info("All services stopped")
         
         # Publish system shutdown event
-        self.event_bus.publish(Event(
-            type="system_shutdown",
-            data={"timestamp": time.time()},
-            source="ServiceManager"
-        ))
+        self._emit_system_shutdown()
     
-    async def restart_service(self, name: str) -> None:
+    async def restart_service(self, name: str, overlap: bool = False) -> None:
         """
         Restart a specific service
         
         Args:
             name: Service name to restart
+            overlap: Run stop and start concurrently if the service is reentrant;
+                otherwise the service is fully stopped before it is started
         """
-        if name not in self._services:
+        service_info = self._services.get(name)
+        if service_info is None:
             raise ValueError(f"Service '{name}' not found")
         
-        self.logger.info(f"Restarting service: {name}")
+        self.logger.info("Restarting service: %s", name)
+        
+        if overlap and service_info.reentrant and service_info.status is _RUNNING:
+            await self._restart_overlapped(service_info)
+            return
         
         await self._stop_single_service(name)
         await self._start_single_service(name)
     
+    async def restart_services(self, names: List[str]) -> None:
+        """
+        Restart several services, batching independent ones
+        
+        Services are stopped in reverse dependency level order and started in
+        dependency level order; services within a level are restarted concurrently.
+        
+        Args:
+            names: Service names to restart
+        """
+        requested = set(names)
+        for name in requested:
+            if name not in self._services:
+                raise ValueError(f"Service '{name}' not found")
+        
+        self.logger.info("Restarting services: %s", ", ".join(sorted(requested)))
+        
+        levels = [
+            [name for name in level if name in requested]
+            for level in self._get_startup_levels()
+        ]
+        levels = [level for level in levels if level]
+        
+        for level in reversed(levels):
+            await asyncio.gather(*(self._stop_single_service(name) for name in level))
+        for level in levels:
+            await asyncio.gather(*(self._start_single_service(name) for name in level))
+    
+    async def _restart_overlapped(self, service_info: ServiceInfo) -> None:
+        """Restart a reentrant service, starting it while the previous run stops"""
+        log = self.logger
+        name = service_info.name
+        instance = service_info.instance
+        
+        self._set_status(service_info, _STARTING)
+        service_info.start_time = time.time()
+        service_info.start_time_mono = time.perf_counter()
+        service_info.error_message = None
+        
+        stop_result, start_result = await asyncio.gather(
+            instance.stop_service(), instance.start_service(), return_exceptions=True
+        )
+        
+        if isinstance(stop_result, Exception):
+            log.error("Failed to stop service '%s': %s", name, stop_result)
+        
+        if isinstance(start_result, Exception):
+            log.error("Failed to start service '%s': %s", name, start_result)
+            self._set_status(service_info, _ERROR)
+            service_info.error_message = str(start_result)
+            self._emit_service_error(name, service_info.error_message, OPERATION_START)
+            return
+        
+        self._set_status(service_info, _RUNNING)
+        log.info("Service '%s' restarted successfully", name)
+    
     async def _start_single_service(self, name: str) -> None:
         """Start a single service"""
-        if name not in self._services:
-            self.logger.error(f"Service '{name}' not found")
-            return
+        log = self.logger
         
-        service_info = self._services[name]
+        service_info = self._services.get(name)
+        if service_info is None:
+            log.error("Service '%s' not found", name)
+            return
         
-        if service_info.status == ServiceStatus.RUNNING:
-            self.logger.debug(f"Service '{name}' is already running")
+        if service_info.status is _RUNNING:
+            log.debug("Service '%s' is already running", name)
             return
         
         # Check dependencies
         if not self._are_dependencies_ready(name):
-            self.logger.error(f"Dependencies not ready for service '{name}'")
-            service_info.status = ServiceStatus.ERROR
+            log.error("Dependencies not ready for service '%s'", name)
+            self._set_status(service_info, _ERROR)
             service_info.error_message = "Dependencies not ready"
             return
         
         try:
-            self.logger.info(f"Starting service: {name}")
-            service_info.status = ServiceStatus.STARTING
+            log.info("Starting service: %s", name)
+            self._set_status(service_info, _STARTING)
             service_info.start_time = time.time()
+            service_info.start_time_mono = time.perf_counter()
             service_info.error_message = None
             
             await service_info.instance.start_service()
             
-            service_info.status = ServiceStatus.RUNNING
-            self.logger.info(f"Service '{name}' started successfully")
+            self._set_status(service_info, _RUNNING)
+            log.info("Service '%s' started successfully", name)
             
         except Exception as e:
-            self.logger.error(f"Failed to start service '{name}': {e}")
-            service_info.status = ServiceStatus.ERROR
+            log.error("Failed to start service '%s': %s", name, e)
+            self._set_status(service_info, _ERROR)
             service_info.error_message = str(e)
             
             # Publish error event
-            self.event_bus.publish(Event(
-                type="service_error",
-                data={
-                    "service": name,
-                    "error": str(e),
-                    "operation": "start"
-                },
-                source="ServiceManager"
-            ))
+            self._emit_service_error(name, service_info.error_message, OPERATION_START)
     
     async def _stop_single_service(self, name: str) -> None:
         """Stop a single service"""
-        if name not in self._services:
-            self.logger.error(f"Service '{name}' not found")
-            return
+        log = self.logger
         
-        service_info = self._services[name]
+        service_info = self._services.get(name)
+        if service_info is None:
+            log.error("Service '%s' not found", name)
+            return
         
-        if service_info.status in [ServiceStatus.STOPPED, ServiceStatus.STOPPING]:
-            self.logger.debug(f"Service '{name}' is already stopped or stopping")
+        if service_info.status is _STOPPED or service_info.status is _STOPPING:
+            log.debug("Service '%s' is already stopped or stopping", name)
             return
         
         try:
-            self.logger.info(f"Stopping service: {name}")
-            service_info.status = ServiceStatus.STOPPING
+            log.info("Stopping service: %s", name)
+            self._set_status(service_info, _STOPPING)
             
             await service_info.instance.stop_service()
             
-            service_info.status = ServiceStatus.STOPPED
+            self._set_status(service_info, _STOPPED)
             service_info.start_time = None
-            self.logger.info(f"Service '{name}' stopped successfully")
+            service_info.start_time_mono = None
+            log.info("Service '%s' stopped successfully", name)
             
         except Exception as e:
-            self.logger.error(f"Failed to stop service '{name}': {e}")
-            service_info.status = ServiceStatus.ERROR
+            log.error("Failed to stop service '%s': %s", name, e)
+            self._set_status(service_info, _ERROR)
             service_info.error_message = str(e)
     
-    def _calculate_startup_order(self) -> List[str]:
-        """Calculate the order to start services based on dependencies"""
-        order = []
-        visited = set()
-        temp_visited = set()
-        
-        def visit(service_name: str):
-            if service_name in temp_visited:
-                raise ValueError(f"Circular dependency detected involving '{service_name}'")
-            
-            if service_name in visited:
-                return
-            
-            temp_visited.add(service_name)
-            
-            # Visit dependencies first
-            if service_name in self._services:
-                dependencies = self._services[service_name].dependencies or []
-                for dep in dependencies:
-                    if dep not in self._services:
-                        raise ValueError(f"Dependency '{dep}' not found for service '{service_name}'")
-                    visit(dep)
-            
-            temp_visited.remove(service_name)
-            visited.add(service_name)
-            order.append(service_name)
+    def _set_status(self, service_info: ServiceInfo, status: ServiceStatus) -> None:
+        """Change a service's status, keeping the running/failed indexes in sync"""
+        service_info.status = status
+        name = service_info.name
+        self._running.pop(name, None)
+        self._failed.pop(name, None)
+        if status is _RUNNING:
+            self._running[name] = None
+        elif status is _ERROR:
+            self._failed[name] = None
+    
+    def _calculate_startup_order(self) -> Tuple[str, ...]:
+        """
+        Calculate a depth-first startup order based on dependencies
         
-        # Visit all services
-        for service_name in self._services:
-            if service_name not in visited:
-                visit(service_name)
+        Each service follows its dependencies, visited in declaration order.
+        Uses an explicit stack so deep dependency chains cannot exhaust the
+        recursion limit.
+        """
+        services = self._services
+        state: Dict[str, int] = {}  # missing = unseen, 1 = in progress, 2 = done
+        order: List[str] = []
+        
+        for root in services:
+            if root in state:
+                continue
+            state[root] = 1
+            stack: List[Tuple[str, Iterator[str]]] = [
+                (root, iter(services[root].dependencies or ()))
+            ]
+            while stack:
+                service_name, deps = stack[-1]
+                dep = next(deps, None)
+                if dep is None:
+                    stack.pop()
+                    state[service_name] = 2
+                    order.append(service_name)
+                    continue
+                
+                dep_state = state.get(dep)
+                if dep_state == 2:
+                    continue
+                if dep_state == 1:
+                    raise ValueError(f"Circular dependency detected involving '{dep}'")
+                dep_info = services.get(dep)
+                if dep_info is None:
+                    raise ValueError(f"Dependency '{dep}' not found for service '{service_name}'")
+                state[dep] = 1
+                stack.append((dep, iter(dep_info.dependencies or ())))
+        
+        return tuple(order)
+    
+    def _get_startup_levels(self) -> Tuple[Tuple[str, ...], ...]:
+        """Return the cached startup levels, recomputing them if services changed"""
+        if self._order_dirty or self._levels_cache is None:
+            self._levels_cache = self._calculate_startup_levels()
+            self._order_dirty = False
+        return self._levels_cache
+    
+    def _calculate_startup_levels(self) -> Tuple[Tuple[str, ...], ...]:
+        """
+        Group services into startup levels with Kahn's algorithm.
         
-        return order
+        Every service's dependencies are in earlier levels, so the services
+        within one level can be started concurrently. Names are sorted within
+        each level so the order does not depend on registration order.
+        """
+        for service_name, service_info in self._services.items():
+            for dep in service_info.dependencies or []:
+                if dep not in self._services:
+                    raise ValueError(f"Dependency '{dep}' not found for service '{service_name}'")
+        
+        # O(N + E): each service is emitted once and each dependency edge decremented once
+        in_degree = dict(self._in_degree)
+        levels = []
+        level = sorted(name for name, degree in in_degree.items() if degree == 0)
+        while level:
+            levels.append(tuple(level))
+            next_level = []
+            for service_name in level:
+                for dependent in self._reverse_deps.get(service_name, ()):
+                    in_degree[dependent] -= 1
+                    if in_degree[dependent] == 0:
+                        next_level.append(dependent)
+            level = sorted(next_level)
+        
+        # register_service() rejects cycles, so every service has been emitted
+        return tuple(levels)
     
     def _are_dependencies_ready(self, service_name: str) -> bool:
         """Check if all dependencies of a service are running"""
-        if service_name not in self._services:
+        dependencies = self._dep_sets.get(service_name)
+        if dependencies is None:
             return False
         
-        dependencies = self._services[service_name].dependencies or []
-        
         for dep in dependencies:
-            if dep not in self._services:
-                self.logger.error(f"Dependency '{dep}' not registered")
+            dep_info = self._services.get(dep)
+            if dep_info is None:
+                self.logger.error("Dependency '%s' not registered", dep)
                 return False
             
-            if self._services[dep].status != ServiceStatus.RUNNING:
-                self.logger.debug(f"Dependency '{dep}' is not running (status: {self._services[dep].status})")
+            if dep_info.status is not _RUNNING:
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Dependency '%s' is not running (status: %s)",
+                                      dep, _STATUS_NAMES[dep_info.status])
                 return False
         
         return True
     
+    # Event publishing helpers (positional Event construction, shared source string)
+    def _emit_system_ready(self, running_services: List[str], total_services: int) -> None:
+        """Publish the system ready event"""
+        self.event_bus.publish(Event(
+            "system_ready",
+            {"services_started": running_services, "total_services": total_services},
+            self._source
+        ))
+    
+    def _emit_system_shutdown(self) -> None:
+        """Publish the system shutdown event"""
+        self.event_bus.publish(Event("system_shutdown", {"timestamp_ns": time.time_ns()}, self._source))
+    
+    def _emit_service_error(self, name: str, error: str, operation: str) -> None:
+        """Publish a service error event"""
+        self.event_bus.publish(Event(
+            "service_error",
+            {"service": name, "error": error, "operation": operation},
+            self._source
+        ))
+    
     def _handle_service_started(self, event: Event) -> None:
         """Handle service started events"""
         service_name = event.data.get("service")
         if service_name and service_name in self._services:
-            self.logger.debug(f"Received service started event for: {service_name}")
+            self.logger.debug("Received service started event for: %s", service_name)
     
     def _handle_service_stopped(self, event: Event) -> None:
         """Handle service stopped events"""
         service_name = event.data.get("service")
         if service_name and service_name in self._services:
-            self.logger.debug(f"Received service stopped event for: {service_name}")
+            self.logger.debug("Received service stopped event for: %s", service_name)
     
     def _handle_service_error(self, event: Event) -> None:
         """Handle service error events"""
         service_name = event.data.get("service")
         error = event.data.get("error")
-        self.logger.error(f"Service error in '{service_name}': {error}")
+        self.logger.error("Service error in '%s': %s", service_name, error)
     
     # Status and monitoring methods
     def get_service_status(self, name: str) -> Optional[Dict[str, Any]]:
@@ -360,45 +662,65 @@ class ServiceManager:
         Returns:
             Service status dictionary or None if not found
         """
-        if name not in self._services:
+        service_info = self._services.get(name)
+        if service_info is None:
             return None
         
-        service_info = self._services[name]
+        return self._build_status(service_info, time.perf_counter())
+    
+    def get_all_services_status(self) -> Dict[str, Dict[str, Any]]:
+        """Get status of all services"""
+        now = time.perf_counter()
+        return {name: self._build_status(info, now) for name, info in self._services.items()}
+    
+    def _build_status(self, service_info: ServiceInfo, now: float) -> Dict[str, Any]:
+        """Build the status dictionary of a resolved service at perf_counter() time now"""
         status = {
             "name": service_info.name,
-            "status": service_info.status.value,
+            "status": _STATUS_NAMES[service_info.status],
             "start_time": service_info.start_time,
-            "uptime": time.time() - service_info.start_time if service_info.start_time else None,
+            "uptime": now - service_info.start_time_mono if service_info.start_time_mono is not None else None,
             "error_message": service_info.error_message,
             "dependencies": service_info.dependencies
         }
         
-        # Get internal service status if available
-        try:
-            internal_status = service_info.instance.get_service_status()
-            status["internal_status"] = internal_status
-        except:
-            pass
+        # Get internal service status if available; stop asking once it fails
+        if service_info.has_internal_status:
+            try:
+                status["internal_status"] = service_info.instance.get_service_status()
+            except Exception as e:
+                self.logger.debug("Internal status unavailable for '%s': %s", service_info.name, e)
+                service_info.has_internal_status = False
         
         return status
     
-    def get_all_services_status(self) -> Dict[str, Dict[str, Any]]:
-        """Get status of all services"""
-        return {name: self.get_service_status(name) for name in self._services}
-    
     def get_running_services(self) -> List[str]:
         """Get list of currently running services"""
-        return [name for name, info in self._services.items() 
-                if info.status == ServiceStatus.RUNNING]
+        return list(self._running)
     
     def get_failed_services(self) -> List[str]:
         """Get list of failed services"""
-        return [name for name, info in self._services.items() 
-                if info.status == ServiceStatus.ERROR]
+        return list(self._failed)
+    
+    def get_startup_order(self, depth_first: bool = False) -> List[str]:
+        """
+        Get the order services would be started in
+        
+        Args:
+            depth_first: Return the depth-first order, where each service directly
+                follows its dependencies, instead of the level order used by
+                start_all_services
+        
+        Returns:
+            Service names, dependencies before the services that need them
+        """
+        if depth_first:
+            return list(self._calculate_startup_order())
+        return [name for level in self._get_startup_levels() for name in level]
     
     def is_system_ready(self) -> bool:
         """Check if all services are running"""
-        return all(info.status == ServiceStatus.RUNNING for info in self._services.values())
+        return len(self._running) == len(self._services)
 
 
 # Factory function for creating service manager with common services
@@ -460,6 +782,7 @@ def create_service_manager_with_common_services(event_bus: EventBus,
 async def main():
     """Example usage of the service manager"""
     logging.basicConfig(level=logging.INFO)
+    ServiceManager.configure_loop()
     
     # Create event bus (you would use your actual event bus here)
     event_bus = EventBus()
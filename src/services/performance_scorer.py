@@ -6,9 +6,15 @@ Event-driven service that handles all performance scoring calculations and analy
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, List, Set, Tuple, Any, Optional, Union
 import logging
 import asyncio
+import copy
+import os
+import sys
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 
@@ -36,16 +42,165 @@ except ImportError:
         SCORING_FAILED = "scoring_failed"
 
 
-@dataclass
+# Heart rate zone names and the inner edges between them, in ascending order
+HR_ZONE_NAMES = ('rest', 'normal', 'elevated', 'high', 'extreme', 'critical')
+HR_ZONE_EDGES = np.array([60, 100, 150, 180, 190], dtype=np.float64)
+
+
+# Minimum batch size before score_batch spreads scoring across processes
+PARALLEL_SCORING_THRESHOLD = 8
+
+# Number of soldier frames whose statistics are remembered for rescoring
+STATS_CACHE_SIZE = 128
+
+# Communication quality bands: a reading strictly above an edge reaches the next label
+RSSI_QUALITY_EDGES = np.array([-80, -70, -60], dtype=np.float64)
+RSSI_QUALITY_LABELS = np.array(['Poor', 'Fair', 'Good', 'Excellent'])
+
+# Performance status and color for each ten-point score band; index 10 covers 100
+_STATUS_CRITICAL = ("CRITICAL - Immediate attention required", "#c0392b")
+PERFORMANCE_STATUS_TABLE = (
+    _STATUS_CRITICAL, _STATUS_CRITICAL, _STATUS_CRITICAL,
+    _STATUS_CRITICAL, _STATUS_CRITICAL, _STATUS_CRITICAL,
+    ("NEEDS IMPROVEMENT - Below standard", "#e74c3c"),
+    ("SATISFACTORY - Meets requirements", "#e67e22"),
+    ("GOOD - Above average performance", "#f39c12"),
+    ("EXCELLENT - Exemplary performance", "#27ae60"),
+    ("EXCELLENT - Exemplary performance", "#27ae60"),
+)
+
+# Summary labels for activity and equipment, from lowest to highest band; a value
+# reaching a threshold moves up to the next label
+ACTIVITY_LEVEL_LABELS = np.array(['Very Low', 'Low', 'Moderate', 'High'])
+EQUIPMENT_STATUS_LABELS = np.array(['Critical', 'Low', 'Fair', 'Good'])
+GOOD_BATTERY_LEVEL = 60
+
+# Breakdown text for each scoring rule, filled with its points and the value that triggered it
+_RULE_FORMATS = {
+    'low_activity': "Low activity: -{points} points ({value:.0f} avg steps)",
+    'moderate_activity': "Moderate activity: -{points} points ({value:.0f} avg steps)",
+    'wounded': "Wounded status: -{points} points",
+    'kia': "KIA status: -{points} points",
+    'critical_battery': "Critical battery: -{points} points ({value:.1f}%)",
+    'low_battery': "Low battery: -{points} points ({value:.1f}%)",
+    'poor_communication': "Poor communication: -{points} points",
+    'medical_alert': "Medical alerts: -{points} points ({value} alerts)",
+    'safety': "Safety concerns: -{points} points",
+    'excellent_communication': "Excellent communication: +{points} points",
+    'combat_engagement': "Combat engagement: +{points} points ({value} engagements)",
+}
+
+# Communication qualities that score, mapped to their config section and rule
+_COMM_QUALITY_RULES = {
+    'Poor': ('deductions', 'poor_communication'),
+    'Excellent': ('bonuses', 'excellent_communication'),
+}
+
+# Final casualty states that incur a scoring deduction
+_WOUNDED_STATES = frozenset({'WOUNDED'})
+_KIA_STATES = frozenset({'KILL', 'KIA'})
+_DEFAULT_STATUS = 'GOOD'
+
+# Columns read by calculate_comprehensive_stats, extracted once per request
+STATS_COLUMNS = (
+    'Step_Count', 'Fall_Detection', 'Heart_Rate', 'Temperature', 'Battery', 'RSSI',
+    'Weapon', 'Posture', 'Casualty_State', 'Shooter_Callsign', 'Time_Step'
+)
+
+
+# Label columns that stay categorical when they arrive that way, so counting and
+# transition checks work on their integer codes instead of per-row Python objects
+LABEL_COLUMNS = frozenset({'Posture', 'Casualty_State', 'Weapon', 'Shooter_Callsign'})
+
+
+def _column_array(column: pd.Series) -> Union[np.ndarray, pd.Categorical]:
+    """
+    Return a column as an ndarray, with timezone-aware timestamps as UTC datetime64
+    
+    Categorical label columns are returned as pd.Categorical to keep their codes.
+    Numeric columns keep their dtype: the data loader already stores sensor
+    readings as float32, and narrowing float64 input here would move values
+    sitting just under a threshold onto it.
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype) and column.name in LABEL_COLUMNS:
+        return column.array
+    if isinstance(column.dtype, pd.DatetimeTZDtype):
+        return column.to_numpy(dtype='datetime64[ns]')
+    return column.to_numpy()
+
+
+def _present(values: np.ndarray) -> np.ndarray:
+    """
+    Return the non-missing entries of a column array
+    
+    Float arrays with no NaNs are returned as-is, so complete sensor columns
+    are never copied and each statistic is a plain single-pass reduction.
+    """
+    if values.dtype.kind == 'f':
+        missing = np.isnan(values)
+        return values[~missing] if missing.any() else values
+    return values[pd.notna(values)]
+
+
+def classify_comm_quality(rssi: Union[float, np.ndarray]) -> Union[str, np.ndarray]:
+    """
+    Rate communication quality from RSSI (dBm), for one reading or a whole array
+    
+    Arrays are classified in one vectorized pass and return an array of labels.
+    Missing (NaN) readings are rated 'Poor'.
+    """
+    rssi = np.asarray(rssi, dtype=np.float64)
+    index = np.searchsorted(RSSI_QUALITY_EDGES, rssi, side='left')
+    labels = RSSI_QUALITY_LABELS[np.where(np.isnan(rssi), 0, index)]
+    return str(labels) if np.ndim(labels) == 0 else labels
+
+
+def _classify_levels(values: Union[float, np.ndarray], edges: Tuple[float, ...],
+                     labels: np.ndarray) -> Union[str, np.ndarray]:
+    """
+    Label values by the highest edge they reach, checking edges from the top down
+    
+    Matches an if/elif ladder over the edges even when configured thresholds are
+    out of order; values reaching no edge, including NaN, fall in the lowest band.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    reached = values[..., np.newaxis] >= np.asarray(edges, dtype=np.float64)
+    index = np.where(reached.any(axis=-1), len(edges) - np.argmax(reached[..., ::-1], axis=-1), 0)
+    result = labels[index]
+    return str(result) if np.ndim(result) == 0 else result
+
+
+def _summarize(values: np.ndarray, high: float, low: float) -> Tuple[float, float, float, int, int]:
+    """
+    Return min, mean, max and the counts of values above high and below low
+    
+    The mean is accumulated in float64 and the summaries are plain floats, so
+    float32 readings report like float64 ones.
+    """
+    return (
+        float(values.min()),
+        float(values.mean(dtype=np.float64)),
+        float(values.max()),
+        int(np.count_nonzero(values > high)),
+        int(np.count_nonzero(values < low))
+    )
+
+
+# Request/result dataclasses drop their per-instance __dict__ where slots are supported
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ScoringRequest:
     """Request for performance scoring"""
     callsign: str
     soldier_data: pd.DataFrame
     request_id: Optional[str] = None
     custom_config: Optional[Dict[str, Any]] = None
+    reuse_stats: bool = False
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ScoringResult:
     """Result of performance scoring"""
     callsign: str
@@ -64,6 +219,12 @@ class PerformanceScorer:
     Integrates with the event bus system for loose coupling and async processing.
     """
     
+    # __weakref__ keeps the scorer and its bound handlers weak-referenceable
+    __slots__ = (
+        'event_bus', 'logger', '_is_running', '_pending_requests', '_stats_cache',
+        'scoring_config', '__weakref__'
+    )
+    
     def __init__(self, event_bus: EventBus, settings: Optional[Dict[str, Any]] = None):
         """
         Initialize the performance scorer service with event bus integration
@@ -75,11 +236,10 @@ class PerformanceScorer:
         self.event_bus = event_bus
         self.logger = logging.getLogger(__name__)
         self._is_running = False
-        self._pending_requests: Dict[str, ScoringRequest] = {}
-        self.event_bus = event_bus
-        self.logger = logging.getLogger(__name__)
-        self._is_running = False
-        self._pending_requests: Dict[str, ScoringRequest] = {}
+        # IDs of requests being scored; only touched from the event loop thread
+        self._pending_requests: Set[str] = set()
+        # id(frame) -> (weak frame reference, callsign, stats, safety analysis)
+        self._stats_cache: OrderedDict[int, Tuple[weakref.ref, str, Dict[str, Any], Dict[str, Any]]] = OrderedDict()
         
         # Initialize scoring configuration
         self.scoring_config = {
@@ -159,6 +319,7 @@ class PerformanceScorer:
         """Stop the performance scorer service"""
         self._is_running = False
         self._pending_requests.clear()
+        self.clear_cache()
         self.logger.info("PerformanceScorer service stopped")
         
         # Publish service stopped event
@@ -186,6 +347,7 @@ class PerformanceScorer:
             soldier_data = request_data.get('soldier_data')
             request_id = request_data.get('request_id')
             custom_config = request_data.get('custom_config')
+            reuse_stats = request_data.get('reuse_stats', False)
             
             if not callsign or soldier_data is None:
                 raise ValueError("Missing required fields: callsign or soldier_data")
@@ -195,14 +357,15 @@ class PerformanceScorer:
                 callsign=callsign,
                 soldier_data=soldier_data,
                 request_id=request_id,
-                custom_config=custom_config
+                custom_config=custom_config,
+                reuse_stats=reuse_stats
             )
             
             # Process the request asynchronously
             asyncio.create_task(self._process_scoring_request(scoring_request))
             
         except Exception as e:
-            self.logger.error(f"Error handling scoring request: {e}")
+            self.logger.error("Error handling scoring request: %s", e)
             self._publish_scoring_error(event.data.get('request_id'), str(e))
     
     async def _process_scoring_request(self, request: ScoringRequest) -> None:
@@ -212,76 +375,99 @@ class PerformanceScorer:
         Args:
             request: Scoring request to process
         """
+        request_id = request.request_id
+        if request_id:
+            self._pending_requests.add(request_id)
+        
         try:
-            if request.request_id:
-                self._pending_requests[request.request_id] = request
-            
-            self.logger.info(f"Processing scoring request for soldier: {request.callsign}")
+            self.logger.info("Processing scoring request for soldier: %s", request.callsign)
             
             # Apply custom configuration if provided
-            original_config = self.scoring_config.copy()
-            if request.custom_config:
-                self._apply_custom_config(request.custom_config)
+            config = self._merge_config(request.custom_config) if request.custom_config else None
             
-            try:
-                # Calculate comprehensive statistics
-                stats = self.calculate_comprehensive_stats(request.callsign, request.soldier_data)
-                
-                # Analyze safety
-                safety_analysis = self.analyze_soldier_safety(request.soldier_data)
-                
-                # Calculate performance score
-                performance_score = self.calculate_performance_score(stats, safety_analysis)
-                
-                # Get performance status
-                status, status_color = self.get_performance_status(performance_score)
-                
-                # Create result
-                result = ScoringResult(
-                    callsign=request.callsign,
-                    performance_score=performance_score,
-                    stats=stats,
-                    safety_analysis=safety_analysis,
-                    status=status,
-                    status_color=status_color,
-                    request_id=request.request_id
-                )
-                
-                # Publish success event
-                self._publish_scoring_success(result)
-                
-            finally:
-                # Restore original configuration
-                if request.custom_config:
-                    self.scoring_config = original_config
+            # Calculate comprehensive statistics and analyze safety
+            stats, safety_analysis = self._stats_and_safety(
+                request.callsign, request.soldier_data, request.reuse_stats
+            )
             
-            # Remove from pending requests
-            if request.request_id and request.request_id in self._pending_requests:
-                del self._pending_requests[request.request_id]
-                
-            self.logger.info(f"Completed scoring for soldier: {request.callsign}")
+            # Calculate performance score
+            performance_score = self.calculate_performance_score(stats, safety_analysis, config)
+            
+            # Get performance status
+            status, status_color = self.get_performance_status(performance_score)
+            
+            # Create result
+            result = ScoringResult(
+                callsign=request.callsign,
+                performance_score=performance_score,
+                stats=stats,
+                safety_analysis=safety_analysis,
+                status=status,
+                status_color=status_color,
+                request_id=request.request_id
+            )
+            
+            # Publish success event
+            self._publish_scoring_success(result)
+            
+            self.logger.info("Completed scoring for soldier: %s", request.callsign)
             
         except Exception as e:
-            self.logger.error(f"Error processing scoring request for {request.callsign}: {e}")
+            self.logger.error("Error processing scoring request for %s: %s", request.callsign, e)
             self._publish_scoring_error(request.request_id, str(e), request.callsign)
-            
-            # Remove from pending requests on error
-            if request.request_id and request.request_id in self._pending_requests:
-                del self._pending_requests[request.request_id]
-    
-    def _apply_custom_config(self, custom_config: Dict[str, Any]) -> None:
-        """Apply custom configuration for a specific request"""
-        if 'deductions' in custom_config:
-            self.scoring_config['deductions'].update(custom_config['deductions'])
-        
-        if 'bonuses' in custom_config:
-            self.scoring_config['bonuses'].update(custom_config['bonuses'])
         
-        if 'activity_thresholds' in custom_config:
-            self.scoring_config['activity_thresholds'].update(custom_config['activity_thresholds'])
+        finally:
+            if request_id:
+                self._pending_requests.discard(request_id)
+    
+    def clear_cache(self) -> None:
+        """Forget remembered statistics (e.g. after modifying a scored frame in place)"""
+        self._stats_cache.clear()
+    
+    def _stats_and_safety(self, callsign: str, soldier_data: pd.DataFrame,
+                          reuse: bool = False) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Return statistics and safety analysis, optionally reusing earlier results
+        
+        Only the performance score depends on the scoring configuration, so a
+        caller rescoring the same DataFrame object (e.g. while tuning
+        custom_config) can pass ``reuse=True`` to skip the data pass. Frames are
+        matched by identity through a weak reference, which cannot see in-place
+        edits, so reuse is opt-in and the default always analyses the data.
+        Callers get copies, since scoring adds to the stats dict.
+        """
+        if not reuse:
+            return (self.calculate_comprehensive_stats(callsign, soldier_data),
+                    self.analyze_soldier_safety(soldier_data))
+        
+        key = id(soldier_data)
+        entry = self._stats_cache.get(key)
+        if entry is not None and entry[0]() is soldier_data and entry[1] == callsign:
+            self._stats_cache.move_to_end(key)
+            stats, safety_analysis = entry[2], entry[3]
+        else:
+            stats = self.calculate_comprehensive_stats(callsign, soldier_data)
+            safety_analysis = self.analyze_soldier_safety(soldier_data)
+            self._stats_cache[key] = (weakref.ref(soldier_data), callsign, stats, safety_analysis)
+            self._stats_cache.move_to_end(key)
+            if len(self._stats_cache) > STATS_CACHE_SIZE:
+                self._stats_cache.popitem(last=False)
+        
+        return copy.deepcopy(stats), copy.deepcopy(safety_analysis)
+    
+    def _merge_config(self, custom_config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the scoring configuration for a single request
         
-        if 'battery_thresholds' in custom_config:
-            self.scoring_config['battery_thresholds'].update(custom_config['battery_thresholds'])
+        The request's overrides are layered over copies of the affected sections,
+        so self.scoring_config is never modified and concurrent requests cannot
+        see each other's settings.
+        """
+        config = dict(self.scoring_config)
+        for section in ('deductions', 'bonuses', 'activity_thresholds', 'battery_thresholds'):
+            if section in custom_config:
+                config[section] = {**config[section], **custom_config[section]}
+        return config
     
     def _publish_scoring_success(self, result: ScoringResult) -> None:
         """Publish scoring success event"""
@@ -315,17 +501,65 @@ class PerformanceScorer:
         return {
             'is_running': self._is_running,
             'pending_requests': len(self._pending_requests),
-            'pending_request_ids': list(self._pending_requests.keys()),
             'config_loaded': bool(self.scoring_config)
         }
     
     def get_pending_requests(self) -> List[str]:
-        """Get list of pending request IDs"""
-        return list(self._pending_requests.keys())
+        """Get a snapshot of pending request IDs"""
+        return list(self._pending_requests)
     
     # Public API methods for external use (non-event driven)
+    async def score_batch(self, requests: List[ScoringRequest], max_workers: Optional[int] = None,
+                          parallel_threshold: int = PARALLEL_SCORING_THRESHOLD) -> List[ScoringResult]:
+        """
+        Score many soldiers, spreading the work across processes
+        
+        Batches of at least ``parallel_threshold`` requests are scored in a
+        process pool, each worker holding its own scorer with this scorer's
+        configuration; smaller batches are scored in-process. The event loop
+        is not blocked while a pooled batch runs.
+        
+        Args:
+            requests: Scoring requests to process
+            max_workers: Worker process count (defaults to CPU count)
+            parallel_threshold: Minimum batch size for process scoring
+            
+        Returns:
+            Scoring results, in the same order as ``requests``
+        """
+        if len(requests) < parallel_threshold:
+            results = [
+                self.score_soldier_sync(request.callsign, request.soldier_data, request.custom_config,
+                                        request.reuse_stats)
+                for request in requests
+            ]
+        else:
+            workers = max_workers or os.cpu_count() or 1
+            # Bound in-flight submissions so only a few soldier frames are pickled at once
+            semaphore = asyncio.Semaphore(workers)
+            loop = asyncio.get_running_loop()
+            
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_scoring_worker,
+                initargs=(self.scoring_config,)
+            ) as executor:
+                async def score_one(request: ScoringRequest) -> ScoringResult:
+                    async with semaphore:
+                        return await loop.run_in_executor(
+                            executor, _score_in_worker,
+                            request.callsign, request.soldier_data, request.custom_config
+                        )
+                
+                results = await asyncio.gather(*(score_one(request) for request in requests))
+        
+        for request, result in zip(requests, results):
+            result.request_id = request.request_id
+        return list(results)
+    
     def score_soldier_sync(self, callsign: str, soldier_data: pd.DataFrame, 
-                          custom_config: Optional[Dict[str, Any]] = None) -> ScoringResult:
+                          custom_config: Optional[Dict[str, Any]] = None,
+                          reuse_stats: bool = False) -> ScoringResult:
         """
         Synchronous scoring method for direct API usage
         
@@ -333,44 +567,34 @@ class PerformanceScorer:
             callsign: Soldier callsign
             soldier_data: Soldier data DataFrame
             custom_config: Optional custom scoring configuration
+            reuse_stats: Reuse statistics from an earlier call on this same
+                DataFrame object; only safe if the frame has not been modified
             
         Returns:
             ScoringResult with performance analysis
         """
         try:
             # Apply custom configuration if provided
-            original_config = None
-            if custom_config:
-                original_config = self.scoring_config.copy()
-                self._apply_custom_config(custom_config)
+            config = self._merge_config(custom_config) if custom_config else None
+            
+            # Calculate comprehensive statistics and analyze safety
+            stats, safety_analysis = self._stats_and_safety(callsign, soldier_data, reuse_stats)
+            
+            # Calculate performance score
+            performance_score = self.calculate_performance_score(stats, safety_analysis, config)
+            
+            # Get performance status
+            status, status_color = self.get_performance_status(performance_score)
+            
+            return ScoringResult(
+                callsign=callsign,
+                performance_score=performance_score,
+                stats=stats,
+                safety_analysis=safety_analysis,
+                status=status,
+                status_color=status_color
+            )
             
-            try:
-                # Calculate comprehensive statistics
-                stats = self.calculate_comprehensive_stats(callsign, soldier_data)
-                
-                # Analyze safety
-                safety_analysis = self.analyze_soldier_safety(soldier_data)
-                
-                # Calculate performance score
-                performance_score = self.calculate_performance_score(stats, safety_analysis)
-                
-                # Get performance status
-                status, status_color = self.get_performance_status(performance_score)
-                
-                return ScoringResult(
-                    callsign=callsign,
-                    performance_score=performance_score,
-                    stats=stats,
-                    safety_analysis=safety_analysis,
-                    status=status,
-                    status_color=status_color
-                )
-                
-            finally:
-                # Restore original configuration
-                if original_config:
-                    self.scoring_config = original_config
-                    
         except Exception as e:
             return ScoringResult(
                 callsign=callsign,
@@ -382,6 +606,28 @@ class PerformanceScorer:
                 error=str(e)
             )
     
+    def score_fleet(self, data: pd.DataFrame, callsign_column: str = 'Callsign',
+                    custom_config: Optional[Dict[str, Any]] = None) -> Dict[str, ScoringResult]:
+        """
+        Score every soldier in a combined dataset
+        
+        Rows are split by callsign with a single groupby pass rather than one
+        boolean filter per soldier.
+        
+        Args:
+            data: Data for all soldiers
+            callsign_column: Column identifying each soldier
+            custom_config: Optional custom scoring configuration for every soldier
+            
+        Returns:
+            ScoringResult per callsign, in order of first appearance
+        """
+        row_positions = data.groupby(callsign_column, sort=False, observed=True).indices
+        return {
+            callsign: self.score_soldier_sync(callsign, data.take(rows), custom_config)
+            for callsign, rows in row_positions.items()
+        }
+    
     def calculate_comprehensive_stats(self, callsign: str, soldier_data: pd.DataFrame) -> Dict[str, Any]:
         """Calculate comprehensive soldier statistics"""
         stats = {
@@ -389,157 +635,161 @@ class PerformanceScorer:
             'total_records': len(soldier_data),
         }
         
+        # Pull each needed column out as an ndarray once; the metric helpers share them
+        columns = soldier_data.columns
+        arrays = {name: _column_array(soldier_data[name]) for name in STATS_COLUMNS if name in columns}
+        
         # Physical activity metrics
-        stats.update(self._calculate_physical_metrics(soldier_data))
+        stats.update(self._calculate_physical_metrics(arrays))
         
         # Heart rate analysis
-        stats.update(self._calculate_heart_rate_metrics(soldier_data))
+        stats.update(self._calculate_heart_rate_metrics(arrays))
         
         # Temperature analysis
-        stats.update(self._calculate_temperature_metrics(soldier_data))
+        stats.update(self._calculate_temperature_metrics(arrays))
         
         # Equipment status
-        stats.update(self._calculate_equipment_metrics(soldier_data))
+        stats.update(self._calculate_equipment_metrics(arrays))
         
         # Posture and movement analysis
-        stats.update(self._calculate_posture_metrics(soldier_data))
+        stats.update(self._calculate_posture_metrics(arrays))
         
         # Combat effectiveness
-        stats.update(self._calculate_combat_metrics(soldier_data))
+        stats.update(self._calculate_combat_metrics(arrays))
         
         # Mission duration
-        stats.update(self._calculate_mission_metrics(soldier_data))
+        stats.update(self._calculate_mission_metrics(arrays))
         
         return stats
     
-    def _calculate_physical_metrics(self, soldier_data: pd.DataFrame) -> Dict[str, Any]:
+    def _calculate_physical_metrics(self, arrays: Dict[str, np.ndarray]) -> Dict[str, Any]:
         """Calculate physical activity metrics"""
         metrics = {}
         
-        if 'Step_Count' in soldier_data.columns:
-            step_data = soldier_data['Step_Count'].dropna()
-            if len(step_data) > 0:
+        if 'Step_Count' in arrays:
+            step_values = _present(arrays['Step_Count'])
+            if len(step_values) > 0:
                 metrics.update({
-                    'total_steps': step_data.sum(),
-                    'avg_steps': step_data.mean(),
-                    'max_steps': step_data.max(),
-                    'min_steps': step_data.min()
+                    'total_steps': step_values.sum(),
+                    'avg_steps': step_values.mean(),
+                    'max_steps': step_values.max(),
+                    'min_steps': step_values.min()
                 })
         
         # Fall incidents
-        if 'Fall_Detection' in soldier_data.columns:
-            metrics['fall_incidents'] = soldier_data['Fall_Detection'].sum()
+        if 'Fall_Detection' in arrays:
+            metrics['fall_incidents'] = _present(arrays['Fall_Detection']).sum()
         
         return metrics
     
-    def _calculate_heart_rate_metrics(self, soldier_data: pd.DataFrame) -> Dict[str, Any]:
+    def _calculate_heart_rate_metrics(self, arrays: Dict[str, np.ndarray]) -> Dict[str, Any]:
         """Calculate heart rate analysis metrics"""
         metrics = {}
         
-        if 'Heart_Rate' in soldier_data.columns:
-            hr_data = soldier_data['Heart_Rate'].dropna()
-            if len(hr_data) > 0:
+        if 'Heart_Rate' in arrays:
+            hr_values = _present(arrays['Heart_Rate'])
+            if len(hr_values) > 0:
+                # Zone index = number of inner zone edges <= hr, counted in one pass
+                zone_counts = np.bincount(
+                    np.searchsorted(HR_ZONE_EDGES, hr_values, side='right'),
+                    minlength=len(HR_ZONE_NAMES)
+                ).tolist()
+                
                 metrics.update({
-                    'min_heart_rate': hr_data.min(),
-                    'avg_heart_rate': hr_data.mean(),
-                    'max_heart_rate': hr_data.max(),
-                    'abnormal_hr_low': len(hr_data[hr_data < 60]),
-                    'abnormal_hr_high': len(hr_data[hr_data > 190])
+                    'min_heart_rate': float(hr_values.min()),
+                    'avg_heart_rate': float(hr_values.mean(dtype=np.float64)),
+                    'max_heart_rate': float(hr_values.max()),
+                    'abnormal_hr_low': zone_counts[0],
+                    # 'critical' includes exactly 190 BPM; the alert threshold is strict
+                    'abnormal_hr_high': int(np.count_nonzero(hr_values > 190))
                 })
                 
                 metrics['abnormal_hr_total'] = metrics['abnormal_hr_low'] + metrics['abnormal_hr_high']
                 metrics['hr_alert_triggered'] = metrics['abnormal_hr_total'] > 0
                 
                 # Heart rate zones
-                metrics['hr_zones'] = {
-                    'rest': len(hr_data[hr_data < 60]),
-                    'normal': len(hr_data[(hr_data >= 60) & (hr_data < 100)]),
-                    'elevated': len(hr_data[(hr_data >= 100) & (hr_data < 150)]),
-                    'high': len(hr_data[(hr_data >= 150) & (hr_data < 180)]),
-                    'extreme': len(hr_data[(hr_data >= 180) & (hr_data < 190)]),
-                    'critical': len(hr_data[hr_data >= 190])
-                }
+                metrics['hr_zones'] = dict(zip(HR_ZONE_NAMES, zone_counts))
         
         return metrics
     
-    def _calculate_temperature_metrics(self, soldier_data: pd.DataFrame) -> Dict[str, Any]:
+    def _calculate_temperature_metrics(self, arrays: Dict[str, np.ndarray]) -> Dict[str, Any]:
         """Calculate temperature analysis metrics"""
         metrics = {}
         
-        if 'Temperature' in soldier_data.columns:
-            temp_data = soldier_data['Temperature'].dropna()
-            if len(temp_data) > 0:
+        if 'Temperature' in arrays:
+            temp_values = _present(arrays['Temperature'])
+            if len(temp_values) > 0:
+                min_temp, avg_temp, max_temp, heat_incidents, cold_incidents = _summarize(temp_values, 104, 95)
                 metrics.update({
-                    'min_temperature': temp_data.min(),
-                    'avg_temperature': temp_data.mean(),
-                    'max_temperature': temp_data.max(),
-                    'heat_stress_incidents': len(temp_data[temp_data > 104]),
-                    'cold_stress_incidents': len(temp_data[temp_data < 95])
+                    'min_temperature': min_temp,
+                    'avg_temperature': avg_temp,
+                    'max_temperature': max_temp,
+                    'heat_stress_incidents': heat_incidents,
+                    'cold_stress_incidents': cold_incidents
                 })
         
         return metrics
     
-    def _calculate_equipment_metrics(self, soldier_data: pd.DataFrame) -> Dict[str, Any]:
+    def _calculate_equipment_metrics(self, arrays: Dict[str, np.ndarray]) -> Dict[str, Any]:
         """Calculate equipment status metrics"""
         metrics = {}
         
         # Battery status
-        if 'Battery' in soldier_data.columns:
-            battery_data = soldier_data['Battery'].dropna()
-            if len(battery_data) > 0:
+        if 'Battery' in arrays:
+            battery_values = _present(arrays['Battery'])
+            if len(battery_values) > 0:
+                # Nothing exceeds 100%, so only the two low-side counts are used
+                min_battery, avg_battery, max_battery, _, low_incidents = _summarize(battery_values, 100, 20)
                 metrics.update({
-                    'min_battery': battery_data.min(),
-                    'avg_battery': battery_data.mean(),
-                    'max_battery': battery_data.max(),
-                    'low_battery_incidents': len(battery_data[battery_data < 20]),
-                    'critical_battery_incidents': len(battery_data[battery_data < 10])
+                    'min_battery': min_battery,
+                    'avg_battery': avg_battery,
+                    'max_battery': max_battery,
+                    'low_battery_incidents': low_incidents,
+                    'critical_battery_incidents': int(np.count_nonzero(battery_values < 10))
                 })
         
         # Communication quality
-        if 'RSSI' in soldier_data.columns:
-            rssi_data = soldier_data['RSSI'].dropna()
-            if len(rssi_data) > 0:
+        if 'RSSI' in arrays:
+            rssi_values = _present(arrays['RSSI'])
+            if len(rssi_values) > 0:
                 metrics.update({
-                    'avg_rssi': rssi_data.mean(),
-                    'min_rssi': rssi_data.min(),
-                    'max_rssi': rssi_data.max()
+                    'avg_rssi': float(rssi_values.mean(dtype=np.float64)),
+                    'min_rssi': float(rssi_values.min()),
+                    'max_rssi': float(rssi_values.max())
                 })
                 
                 # Communication quality rating
-                avg_rssi = metrics['avg_rssi']
-                if avg_rssi > -60:
-                    metrics['comm_quality'] = 'Excellent'
-                elif avg_rssi > -70:
-                    metrics['comm_quality'] = 'Good'
-                elif avg_rssi > -80:
-                    metrics['comm_quality'] = 'Fair'
-                else:
-                    metrics['comm_quality'] = 'Poor'
+                metrics['comm_quality'] = classify_comm_quality(metrics['avg_rssi'])
         
         # Weapon information
-        if 'Weapon' in soldier_data.columns:
-            weapon_data = soldier_data['Weapon'].dropna()
-            if len(weapon_data) > 0:
-                metrics['primary_weapon'] = weapon_data.mode().iloc[0] if not weapon_data.mode().empty else 'Unknown'
+        if 'Weapon' in arrays:
+            weapon_values = _present(arrays['Weapon'])
+            if len(weapon_values) > 0:
+                # Most frequent weapon; ties go to the first in sorted order, as with Series.mode()
+                weapon_codes, weapons = pd.factorize(weapon_values)
+                weapon_counts = np.bincount(weapon_codes, minlength=len(weapons))
+                metrics['primary_weapon'] = min(weapons[weapon_counts == weapon_counts.max()])
         
         return metrics
     
-    def _calculate_posture_metrics(self, soldier_data: pd.DataFrame) -> Dict[str, Any]:
+    def _calculate_posture_metrics(self, arrays: Dict[str, np.ndarray]) -> Dict[str, Any]:
         """Calculate posture and movement metrics"""
         metrics = {}
         
-        if 'Posture' in soldier_data.columns:
-            posture_data = soldier_data['Posture'].dropna()
-            if len(posture_data) > 0:
-                posture_counts = posture_data.value_counts()
-                metrics['posture_distribution'] = posture_counts.to_dict()
-                metrics['dominant_posture'] = posture_counts.index[0] if len(posture_counts) > 0 else 'Unknown'
+        if 'Posture' in arrays:
+            postures = _present(arrays['Posture'])
+            if len(postures) > 0:
+                # Hash-encode to integer codes once; counts and transitions then run on ints
+                posture_codes, posture_values = pd.factorize(postures)
+                posture_counts = np.bincount(posture_codes, minlength=len(posture_values))
+                by_count = np.argsort(-posture_counts, kind='stable')
+                metrics['posture_distribution'] = dict(zip(
+                    posture_values[by_count].tolist(), posture_counts[by_count].tolist()
+                ))
+                metrics['dominant_posture'] = posture_values[by_count[0]]
                 
                 # Calculate posture changes
-                posture_changes = 0
-                for i in range(1, len(posture_data)):
-                    if posture_data.iloc[i] != posture_data.iloc[i-1]:
-                        posture_changes += 1
+                posture_changes = int(np.count_nonzero(posture_codes[1:] != posture_codes[:-1]))
                 metrics['posture_changes'] = posture_changes
                 
                 if posture_changes < 10:
@@ -551,44 +801,42 @@ class PerformanceScorer:
         
         return metrics
     
-    def _calculate_combat_metrics(self, soldier_data: pd.DataFrame) -> Dict[str, Any]:
+    def _calculate_combat_metrics(self, arrays: Dict[str, np.ndarray]) -> Dict[str, Any]:
         """Calculate combat effectiveness metrics"""
         metrics = {}
         
         # Casualty status
-        if 'Casualty_State' in soldier_data.columns:
-            casualty_data = soldier_data['Casualty_State'].dropna()
-            if len(casualty_data) > 0:
-                metrics['final_status'] = casualty_data.iloc[-1]
+        if 'Casualty_State' in arrays:
+            casualty_states = _present(arrays['Casualty_State'])
+            if len(casualty_states) > 0:
+                metrics['final_status'] = casualty_states[-1]
                 
                 # Count status changes
-                casualty_changes = 0
-                for i in range(1, len(casualty_data)):
-                    if casualty_data.iloc[i] != casualty_data.iloc[i-1]:
-                        casualty_changes += 1
-                metrics['casualty_events'] = casualty_changes
+                metrics['casualty_events'] = int(np.count_nonzero(casualty_states[1:] != casualty_states[:-1]))
         
         # Combat engagements
-        if 'Shooter_Callsign' in soldier_data.columns:
-            engagement_data = soldier_data['Shooter_Callsign'].dropna()
-            metrics['combat_engagements'] = len(engagement_data)
-            if len(engagement_data) > 0:
-                metrics['unique_shooters'] = engagement_data.nunique()
+        if 'Shooter_Callsign' in arrays:
+            shooters = _present(arrays['Shooter_Callsign'])
+            metrics['combat_engagements'] = len(shooters)
+            if len(shooters) > 0:
+                metrics['unique_shooters'] = len(pd.unique(shooters))
         
         return metrics
     
-    def _calculate_mission_metrics(self, soldier_data: pd.DataFrame) -> Dict[str, Any]:
+    def _calculate_mission_metrics(self, arrays: Dict[str, np.ndarray]) -> Dict[str, Any]:
         """Calculate mission duration and timing metrics"""
         metrics = {}
         
-        if 'Time_Step' in soldier_data.columns:
-            try:
-                if pd.api.types.is_datetime64_any_dtype(soldier_data['Time_Step']):
-                    start_time = soldier_data['Time_Step'].min()
-                    end_time = soldier_data['Time_Step'].max()
-                    metrics['mission_duration'] = (end_time - start_time).total_seconds() / 60  # minutes
-            except:
-                pass
+        # Only datetime timestamps give a duration; numeric or unparsed Time_Step is skipped
+        time_steps = arrays.get('Time_Step')
+        if time_steps is not None and pd.api.types.is_datetime64_any_dtype(time_steps):
+            time_steps = _present(time_steps)
+            if len(time_steps) > 0:
+                metrics['mission_duration'] = float(
+                    (time_steps.max() - time_steps.min()) / np.timedelta64(1, 'm')
+                )  # minutes
+            else:
+                metrics['mission_duration'] = float('nan')
         
         return metrics
     
@@ -613,6 +861,8 @@ class PerformanceScorer:
         # Equipment safety analysis
         safety.update(self._analyze_equipment_safety(soldier_data, safety))
         
+        safety['medical_alert_count'] = len(safety['medical_alerts'])
+        
         return safety
     
     def _analyze_temperature_safety(self, soldier_data: pd.DataFrame, safety: Dict[str, Any]) -> Dict[str, Any]:
@@ -620,10 +870,10 @@ class PerformanceScorer:
         updates = {}
         
         if 'Temperature' in soldier_data.columns:
-            temp_data = soldier_data['Temperature'].dropna()
-            if len(temp_data) > 0:
-                max_temp = temp_data.max()
-                min_temp = temp_data.min()
+            temp_values = _present(soldier_data['Temperature'].to_numpy())
+            if len(temp_values) > 0:
+                max_temp = temp_values.max()
+                min_temp = temp_values.min()
                 
                 if max_temp > 104:  # Heat stroke risk
                     updates['temperature_risk'] = 'CRITICAL'
@@ -645,10 +895,10 @@ class PerformanceScorer:
         updates = {}
         
         if 'Heart_Rate' in soldier_data.columns:
-            hr_data = soldier_data['Heart_Rate'].dropna()
-            if len(hr_data) > 0:
-                max_hr = hr_data.max()
-                min_hr = hr_data.min()
+            hr_values = _present(soldier_data['Heart_Rate'].to_numpy())
+            if len(hr_values) > 0:
+                max_hr = hr_values.max()
+                min_hr = hr_values.min()
                 
                 if max_hr > 190:
                     updates['physiological_stress'] = 'CRITICAL'
@@ -671,9 +921,9 @@ class PerformanceScorer:
         updates = {}
         
         if 'Battery' in soldier_data.columns:
-            battery_data = soldier_data['Battery'].dropna()
-            if len(battery_data) > 0:
-                min_battery = battery_data.min()
+            battery_values = _present(soldier_data['Battery'].to_numpy())
+            if len(battery_values) > 0:
+                min_battery = battery_values.min()
                 if min_battery < 10:
                     updates['equipment_risk'] = 'CRITICAL'
                     safety['overall_safety_score'] -= 15
@@ -684,119 +934,197 @@ class PerformanceScorer:
         
         return updates
     
-    def calculate_performance_score(self, stats: Dict[str, Any], safety_analysis: Dict[str, Any]) -> int:
-        """Calculate comprehensive performance score"""
-        score = self.scoring_config['base_score']
+    def calculate_performance_score(self, stats: Dict[str, Any], safety_analysis: Dict[str, Any],
+                                    config: Optional[Dict[str, Any]] = None,
+                                    include_details: bool = True) -> int:
+        """
+        Calculate comprehensive performance score
+        
+        Args:
+            stats: Statistics from calculate_comprehensive_stats
+            safety_analysis: Results from analyze_soldier_safety
+            config: Scoring configuration to use instead of self.scoring_config
+            include_details: Format the breakdown's deduction and bonus details as text;
+                when False the breakdown keeps the (rule, points, value) tuples instead
+        """
+        if config is None:
+            config = self.scoring_config
+        base_score = config['base_score']
+        deduction_points = config['deductions']
+        bonus_points = config['bonuses']
+        activity_thresholds = config['activity_thresholds']
+        battery_thresholds = config['battery_thresholds']
+        
+        score = base_score
+        total_deductions = 0
+        total_bonuses = 0
         deductions = []
         bonuses = []
         
         # Activity performance
         if 'avg_steps' in stats:
             avg_steps = stats['avg_steps']
-            if avg_steps < self.scoring_config['activity_thresholds']['low']:
-                deduction = self.scoring_config['deductions']['low_activity']
-                score -= deduction
-                deductions.append(f"Low activity: -{deduction} points ({avg_steps:.0f} avg steps)")
-            elif avg_steps < self.scoring_config['activity_thresholds']['moderate']:
-                deduction = self.scoring_config['deductions']['moderate_activity']
-                score -= deduction
-                deductions.append(f"Moderate activity: -{deduction} points ({avg_steps:.0f} avg steps)")
+            if avg_steps < activity_thresholds['low']:
+                deductions.append(('low_activity', deduction_points['low_activity'], avg_steps))
+            elif avg_steps < activity_thresholds['moderate']:
+                deductions.append(('moderate_activity', deduction_points['moderate_activity'], avg_steps))
         
         # Casualty status impact
-        final_status = stats.get('final_status', 'GOOD')
-        if final_status == 'WOUNDED':
-            deduction = self.scoring_config['deductions']['wounded']
-            score -= deduction
-            deductions.append(f"Wounded status: -{deduction} points")
-        elif final_status in ['KILL', 'KIA']:
-            deduction = self.scoring_config['deductions']['kia']
-            score -= deduction
-            deductions.append(f"KIA status: -{deduction} points")
+        final_status = stats.get('final_status', _DEFAULT_STATUS)
+        if final_status in _WOUNDED_STATES:
+            deductions.append(('wounded', deduction_points['wounded'], None))
+        elif final_status in _KIA_STATES:
+            deductions.append(('kia', deduction_points['kia'], None))
         
         # Equipment readiness
         if 'avg_battery' in stats:
             avg_battery = stats['avg_battery']
-            if avg_battery < self.scoring_config['battery_thresholds']['critical']:
-                deduction = self.scoring_config['deductions']['critical_battery']
-                score -= deduction
-                deductions.append(f"Critical battery: -{deduction} points ({avg_battery:.1f}%)")
-            elif avg_battery < self.scoring_config['battery_thresholds']['low']:
-                deduction = self.scoring_config['deductions']['low_battery']
-                score -= deduction
-                deductions.append(f"Low battery: -{deduction} points ({avg_battery:.1f}%)")
+            if avg_battery < battery_thresholds['critical']:
+                deductions.append(('critical_battery', deduction_points['critical_battery'], avg_battery))
+            elif avg_battery < battery_thresholds['low']:
+                deductions.append(('low_battery', deduction_points['low_battery'], avg_battery))
         
         # Communication quality
-        if 'comm_quality' in stats:
-            comm_quality = stats['comm_quality']
-            if comm_quality == 'Poor':
-                deduction = self.scoring_config['deductions']['poor_communication']
-                score -= deduction
-                deductions.append(f"Poor communication: -{deduction} points")
-            elif comm_quality == 'Excellent':
-                bonus = self.scoring_config['bonuses']['excellent_communication']
-                score += bonus
-                bonuses.append(f"Excellent communication: +{bonus} points")
+        comm_rule = _COMM_QUALITY_RULES.get(stats.get('comm_quality'))
+        if comm_rule is not None:
+            section, rule = comm_rule
+            (bonuses if section == 'bonuses' else deductions).append((rule, config[section][rule], None))
         
         # Combat engagement bonus
         if 'combat_engagements' in stats and stats['combat_engagements'] > 0:
-            bonus = min(self.scoring_config['bonuses']['combat_engagement'], stats['combat_engagements'])
-            score += bonus
-            bonuses.append(f"Combat engagement: +{bonus} points ({stats['combat_engagements']} engagements)")
+            engagements = stats['combat_engagements']
+            bonuses.append(('combat_engagement', min(bonus_points['combat_engagement'], engagements), engagements))
         
         # Medical alerts (reduced penalty - safety focused)
-        medical_alerts = len(safety_analysis.get('medical_alerts', []))
+        medical_alerts = safety_analysis.get('medical_alert_count')
+        if medical_alerts is None:
+            medical_alerts = len(safety_analysis.get('medical_alerts', []))
         if medical_alerts > 0:
-            deduction = medical_alerts * self.scoring_config['deductions']['medical_alert']
-            score -= deduction
-            deductions.append(f"Medical alerts: -{deduction} points ({medical_alerts} alerts)")
+            deductions.append(('medical_alert', medical_alerts * deduction_points['medical_alert'], medical_alerts))
         
         # Safety score impact (20% of deficit)
         safety_score = safety_analysis.get('overall_safety_score', 100)
         if safety_score < 100:
-            deduction = int((100 - safety_score) * 0.2)
-            score -= deduction
-            deductions.append(f"Safety concerns: -{deduction} points")
+            deductions.append(('safety', int((100 - safety_score) * 0.2), None))
+        
+        for _, points, _ in deductions:
+            total_deductions += points
+        for _, points, _ in bonuses:
+            total_bonuses += points
+        score += total_bonuses - total_deductions
         
         final_score = max(0, min(100, score))
         
         # Store breakdown
-        stats['performance_breakdown'] = {
-            'starting_score': self.scoring_config['base_score'],
+        breakdown = {
+            'starting_score': base_score,
             'final_score': final_score,
-            'total_deductions': sum([int(d.split('-')[1].split(' ')[0]) for d in deductions if '-' in d]),
-            'total_bonuses': sum([int(b.split('+')[1].split(' ')[0]) for b in bonuses if '+' in b]),
-            'deduction_details': deductions,
-            'bonus_details': bonuses
+            'total_deductions': total_deductions,
+            'total_bonuses': total_bonuses
         }
+        if include_details:
+            breakdown['deduction_details'] = format_rule_details(deductions)
+            breakdown['bonus_details'] = format_rule_details(bonuses)
+        else:
+            breakdown['deduction_rules'] = deductions
+            breakdown['bonus_rules'] = bonuses
+        stats['performance_breakdown'] = breakdown
         
         return final_score
     
-    def get_performance_status(self, score: int) -> Tuple[str, str]:
+    def calculate_performance_scores_batch(self, stats: pd.DataFrame, safety_analysis: pd.DataFrame,
+                                           config: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        """
+        Calculate performance scores for many soldiers at once
+        
+        Applies the same rules as calculate_performance_score with array
+        operations over all soldiers, without building breakdown strings.
+        Missing columns or values count as absent statistics.
+        
+        Args:
+            stats: One row per soldier with calculate_comprehensive_stats keys as columns
+            safety_analysis: One row per soldier with analyze_soldier_safety keys as columns
+            config: Scoring configuration to use instead of self.scoring_config
+            
+        Returns:
+            Integer scores in row order
+        """
+        if config is None:
+            config = self.scoring_config
+        deduction_points = config['deductions']
+        bonus_points = config['bonuses']
+        activity_thresholds = config['activity_thresholds']
+        battery_thresholds = config['battery_thresholds']
+        
+        count = len(stats)
+        missing = pd.Series(np.nan, index=stats.index)
+        
+        def numeric(frame: pd.DataFrame, column: str, default: float) -> np.ndarray:
+            values = frame[column] if column in frame.columns else missing
+            return pd.to_numeric(values, errors='coerce').fillna(default).to_numpy(dtype=np.float64)
+        
+        score = np.full(count, config['base_score'], dtype=np.int64)
+        
+        # Activity performance (NaN compares false, like an absent statistic)
+        avg_steps = numeric(stats, 'avg_steps', np.nan)
+        score -= np.where(
+            avg_steps < activity_thresholds['low'], deduction_points['low_activity'],
+            np.where(avg_steps < activity_thresholds['moderate'], deduction_points['moderate_activity'], 0)
+        )
+        
+        # Casualty status impact
+        final_status = stats['final_status'] if 'final_status' in stats.columns else missing
+        score -= np.where(
+            final_status.isin(_WOUNDED_STATES), deduction_points['wounded'],
+            np.where(final_status.isin(_KIA_STATES), deduction_points['kia'], 0)
+        )
+        
+        # Equipment readiness
+        avg_battery = numeric(stats, 'avg_battery', np.nan)
+        score -= np.where(
+            avg_battery < battery_thresholds['critical'], deduction_points['critical_battery'],
+            np.where(avg_battery < battery_thresholds['low'], deduction_points['low_battery'], 0)
+        )
+        
+        # Communication quality
+        comm_quality = stats['comm_quality'] if 'comm_quality' in stats.columns else missing
+        score -= np.where(comm_quality == 'Poor', deduction_points['poor_communication'], 0)
+        score += np.where(comm_quality == 'Excellent', bonus_points['excellent_communication'], 0)
+        
+        # Combat engagement bonus
+        engagements = numeric(stats, 'combat_engagements', 0)
+        score += np.minimum(bonus_points['combat_engagement'], np.maximum(engagements, 0)).astype(np.int64)
+        
+        # Medical alerts
+        alert_counts = numeric(safety_analysis, 'medical_alert_count', np.nan)
+        uncounted = np.isnan(alert_counts)
+        if uncounted.any() and 'medical_alerts' in safety_analysis.columns:
+            # Rows without a stored count fall back to the length of their alert list
+            alerts = safety_analysis['medical_alerts'].astype(object)
+            alert_lengths = alerts.str.len().to_numpy(dtype=np.float64, na_value=0)
+            alert_counts = np.where(uncounted, alert_lengths, alert_counts)
+        alert_counts = np.nan_to_num(alert_counts).astype(np.int64)
+        score -= alert_counts * deduction_points['medical_alert']
+        
+        # Safety score impact (20% of deficit)
+        safety_score = numeric(safety_analysis, 'overall_safety_score', 100)
+        score -= np.trunc(np.maximum(100 - safety_score, 0) * 0.2).astype(np.int64)
+        
+        return np.clip(score, 0, 100)
+    
+    @staticmethod
+    def get_performance_status(score: int) -> Tuple[str, str]:
         """Get performance status and color based on score"""
-        if score >= 90:
-            return "EXCELLENT - Exemplary performance", "#27ae60"
-        elif score >= 80:
-            return "GOOD - Above average performance", "#f39c12"
-        elif score >= 70:
-            return "SATISFACTORY - Meets requirements", "#e67e22"
-        elif score >= 60:
-            return "NEEDS IMPROVEMENT - Below standard", "#e74c3c"
-        else:
-            return "CRITICAL - Immediate attention required", "#c0392b"
+        return PERFORMANCE_STATUS_TABLE[int(min(max(score, 0), 100)) // 10]
     
     def update_scoring_config(self, config_updates: Dict[str, Any]) -> None:
-        """Update scoring configuration with new values"""
-        if 'deductions' in config_updates:
-            self.scoring_config['deductions'].update(config_updates['deductions'])
-        
-        if 'bonuses' in config_updates:
-            self.scoring_config['bonuses'].update(config_updates['bonuses'])
-        
-        if 'activity_thresholds' in config_updates:
-            self.scoring_config['activity_thresholds'].update(config_updates['activity_thresholds'])
+        """
+        Update scoring configuration with new values
         
-        if 'battery_thresholds' in config_updates:
-            self.scoring_config['battery_thresholds'].update(config_updates['battery_thresholds'])
+        The configuration is replaced rather than edited in place, so snapshots from
+        get_scoring_config and configs already handed to scoring workers stay as they were.
+        """
+        self.scoring_config = self._merge_config(config_updates)
     
     def get_scoring_config(self) -> Dict[str, Any]:
         """Get current scoring configuration"""
@@ -804,60 +1132,80 @@ class PerformanceScorer:
     
     def generate_scoring_summary(self, stats: Dict[str, Any]) -> Dict[str, Any]:
         """Generate a summary of scoring factors for transparency"""
-        summary = {
-            'activity_level': 'Unknown',
-            'equipment_status': 'Unknown',
-            'communication_quality': stats.get('comm_quality', 'Unknown'),
-            'combat_participation': stats.get('combat_engagements', 0) > 0,
-            'casualty_status': stats.get('final_status', 'Unknown'),
-            'medical_concerns': stats.get('hr_alert_triggered', False)
-        }
+        activity_thresholds = self.scoring_config['activity_thresholds']
+        battery_thresholds = self.scoring_config['battery_thresholds']
         
         # Activity level assessment
+        activity_level = 'Unknown'
         if 'avg_steps' in stats:
-            avg_steps = stats['avg_steps']
-            if avg_steps >= self.scoring_config['activity_thresholds']['high']:
-                summary['activity_level'] = 'High'
-            elif avg_steps >= self.scoring_config['activity_thresholds']['moderate']:
-                summary['activity_level'] = 'Moderate'
-            elif avg_steps >= self.scoring_config['activity_thresholds']['low']:
-                summary['activity_level'] = 'Low'
-            else:
-                summary['activity_level'] = 'Very Low'
+            activity_level = _classify_levels(
+                stats['avg_steps'],
+                (activity_thresholds['low'], activity_thresholds['moderate'], activity_thresholds['high']),
+                ACTIVITY_LEVEL_LABELS
+            )
         
         # Equipment status assessment
+        equipment_status = 'Unknown'
         if 'avg_battery' in stats:
-            avg_battery = stats['avg_battery']
-            if avg_battery >= 60:
-                summary['equipment_status'] = 'Good'
-            elif avg_battery >= self.scoring_config['battery_thresholds']['low']:
-                summary['equipment_status'] = 'Fair'
-            elif avg_battery >= self.scoring_config['battery_thresholds']['critical']:
-                summary['equipment_status'] = 'Low'
-            else:
-                summary['equipment_status'] = 'Critical'
+            equipment_status = _classify_levels(
+                stats['avg_battery'],
+                (battery_thresholds['critical'], battery_thresholds['low'], GOOD_BATTERY_LEVEL),
+                EQUIPMENT_STATUS_LABELS
+            )
         
-        return summary
+        return {
+            'activity_level': activity_level,
+            'equipment_status': equipment_status,
+            'communication_quality': stats.get('comm_quality', 'Unknown'),
+            'combat_participation': stats.get('combat_engagements', 0) > 0,
+            'casualty_status': stats.get('final_status', 'Unknown'),
+            'medical_concerns': stats.get('hr_alert_triggered', False)
+        }
+
+
+def format_rule_details(rules: List[Tuple[str, int, Any]]) -> List[str]:
+    """Format (rule, points, value) tuples from calculate_performance_score as breakdown text"""
+    return [_RULE_FORMATS[rule].format(points=points, value=value) for rule, points, value in rules]
+
+
+_worker_scorer: Optional[PerformanceScorer] = None
+
+
+def _init_scoring_worker(scoring_config: Dict[str, Any]) -> None:
+    """Build the scorer once per worker process"""
+    global _worker_scorer
+    _worker_scorer = PerformanceScorer(EventBus())
+    _worker_scorer.scoring_config = scoring_config
+
+
+def _score_in_worker(callsign: str, soldier_data: pd.DataFrame,
+                     custom_config: Optional[Dict[str, Any]]) -> ScoringResult:
+    """Score a single soldier in a worker process"""
+    return _worker_scorer.score_soldier_sync(callsign, soldier_data, custom_config)
 
 
 def main():
     """Main function for testing the PerformanceScorer"""
     import pandas as pd
     
-    # Create sample data for testing
+    # Create sample data for testing; the fixed seed keeps runs comparable
+    rng = np.random.default_rng(0)
+    steps, heart_rate, battery, rssi = rng.integers([80, 70, 30, -80], [120, 150, 100, -50], size=(100, 4)).T
     sample_data = pd.DataFrame({
-        'Callsign': ['ALPHA1'] * 100,
-        'Step_Count': np.random.randint(80, 120, 100),
-        'Heart_Rate': np.random.randint(70, 150, 100),
-        'Battery': np.random.randint(30, 100, 100),
-        'Temperature': np.random.uniform(98, 102, 100),
-        'RSSI': np.random.randint(-80, -50, 100),
-        'Casualty_State': ['GOOD'] * 95 + ['WOUNDED'] * 5,
-        'Posture': np.random.choice(['Standing', 'Kneeling', 'Prone'], 100)
+        'Callsign': np.full(100, 'ALPHA1', dtype=object),
+        'Step_Count': steps,
+        'Heart_Rate': heart_rate,
+        'Battery': battery,
+        'Temperature': rng.uniform(98, 102, 100),
+        'RSSI': rssi,
+        'Casualty_State': pd.Categorical.from_codes(np.repeat(np.int8([0, 1]), [95, 5]),
+                                                    categories=['GOOD', 'WOUNDED']),
+        'Posture': pd.Categorical.from_codes(rng.integers(0, 3, 100, dtype=np.int8),
+                                             categories=['Standing', 'Kneeling', 'Prone'])
     })
     
     # Test the scorer
-    scorer = PerformanceScorer()
+    scorer = PerformanceScorer(EventBus())
     stats = scorer.calculate_comprehensive_stats('ALPHA1', sample_data)
     safety = scorer.analyze_soldier_safety(sample_data)
     score = scorer.calculate_performance_score(stats, safety)
@@ -40,6 +40,40 @@ except ImportError:
         SAFETY_THRESHOLD_EXCEEDED = "safety_threshold_exceeded"
 
 
+# Sensor columns read by the safety analyzers, extracted once per analysis
+SAFETY_COLUMNS = ('Heart_Rate', 'Temperature', 'Battery', 'RSSI', 'Fall_Detection')
+
+
+# Bit flags returned by SafetyAnalyzer._scan_thresholds for each real-time reading
+ALERT_FLAG_HR_HIGH = 1
+ALERT_FLAG_HR_LOW = 2
+ALERT_FLAG_TEMP_HIGH = 4
+ALERT_FLAG_TEMP_LOW = 8
+ALERT_FLAG_FALL = 16
+
+
+def _readings(column: pd.Series) -> np.ndarray:
+    """
+    Return the non-missing readings of a sensor column as a NumPy array
+    
+    Float columns with no NaNs are returned without a copy, so complete sensor
+    columns are reduced in single passes. Nullable extension columns drop their
+    missing values first so the readings keep their integer dtype.
+    """
+    if not isinstance(column.dtype, np.dtype):
+        return column.dropna().to_numpy()
+    values = column.to_numpy()
+    if values.dtype.kind == 'f':
+        missing = np.isnan(values)
+        return values[~missing] if missing.any() else values
+    return values[pd.notna(values)]
+
+
+def _sample_std(values: np.ndarray) -> float:
+    """Sample standard deviation (ddof=1), NaN for fewer than two readings like pandas"""
+    return values.std(ddof=1) if len(values) > 1 else np.nan
+
+
 class SafetyRiskLevel(Enum):
     """Safety risk level enumeration"""
     LOW = "LOW"
@@ -58,6 +92,15 @@ class MedicalAlertType(Enum):
     FALL_DETECTED = "fall_detected"
 
 
+# Ordering of risk levels from least to most severe
+_SEVERITY_RANK = {
+    SafetyRiskLevel.LOW: 0,
+    SafetyRiskLevel.MODERATE: 1,
+    SafetyRiskLevel.HIGH: 2,
+    SafetyRiskLevel.CRITICAL: 3
+}
+
+
 @dataclass
 class SafetyAnalysisRequest:
     """Request for safety analysis"""
@@ -155,6 +198,7 @@ class SafetyAnalyzer:
         # Override with provided settings
         if settings:
             self._update_config_from_settings(settings)
+        self._rebuild_threshold_cache()
         
         # Register event handlers
         self._register_event_handlers()
@@ -171,6 +215,27 @@ class SafetyAnalyzer:
                 if config_section in safety_settings:
                     self.safety_config[config_section].update(safety_settings[config_section])
     
+    def _rebuild_threshold_cache(self) -> None:
+        """
+        Flatten the threshold sections into tuples for the analysis hot paths
+        
+        Must be called whenever safety_config's threshold sections change.
+        Heart rate and temperature tuples are ordered (critical_high, high,
+        normal_high, normal_low, low, critical_low); equipment is
+        (battery_critical, battery_low, signal_poor).
+        """
+        threshold_keys = ('critical_high', 'high', 'normal_high', 'normal_low', 'low', 'critical_low')
+        hr_thresholds = self.safety_config['heart_rate_thresholds']
+        temp_thresholds = self.safety_config['temperature_thresholds']
+        equipment_thresholds = self.safety_config['equipment_thresholds']
+        self._hr_thresholds = tuple(hr_thresholds[key] for key in threshold_keys)
+        self._temp_thresholds = tuple(temp_thresholds[key] for key in threshold_keys)
+        self._equipment_thresholds = (
+            equipment_thresholds['battery_critical'],
+            equipment_thresholds['battery_low'],
+            equipment_thresholds['signal_poor']
+        )
+    
     def _register_event_handlers(self) -> None:
         """Register event handlers with the event bus"""
         self.event_bus.subscribe(
@@ -277,9 +342,22 @@ class SafetyAnalyzer:
             self._publish_safety_analysis_error(event.data.get('request_id'), str(e))
     
     def _handle_real_time_data(self, event: Event) -> None:
-        """Handle real-time data for immediate safety alerts"""
+        """
+        Handle real-time data for immediate safety alerts
+        
+        The event carries either one soldier's reading or, under 'readings', a list
+        of readings collected over a tick, which are screened together.
+        """
         try:
             data = event.data
+            
+            if 'readings' in data:
+                readings = data['readings']
+                for reading, alerts in zip(readings, self.check_immediate_safety_alerts_batch(readings)):
+                    for alert in alerts:
+                        self._publish_medical_alert(reading.get('callsign'), alert)
+                return
+            
             callsign = data.get('callsign')
             
             # Check for immediate safety concerns
@@ -321,6 +399,7 @@ class SafetyAnalyzer:
                 # Restore original configuration
                 if request.custom_thresholds:
                     self.safety_config = original_config
+                    self._rebuild_threshold_cache()
             
             # Remove from pending requests
             if request.request_id and request.request_id in self._pending_requests:
@@ -347,23 +426,29 @@ class SafetyAnalyzer:
         recommendations = []
         overall_score = self.safety_config['safety_scoring']['base_score']
         
+        # Extract every sensor column once; the analyzers share these arrays
+        readings = {
+            column: _readings(soldier_data[column])
+            for column in SAFETY_COLUMNS if column in soldier_data.columns
+        }
+        
         # Heart rate analysis
-        hr_metrics, hr_alerts = self._analyze_heart_rate(soldier_data)
+        hr_metrics, hr_alerts = self._analyze_heart_rate(readings)
         safety_metrics.update(hr_metrics)
         medical_alerts.extend(hr_alerts)
         
         # Temperature analysis
-        temp_metrics, temp_alerts = self._analyze_temperature(soldier_data)
+        temp_metrics, temp_alerts = self._analyze_temperature(readings)
         safety_metrics.update(temp_metrics)
         medical_alerts.extend(temp_alerts)
         
         # Equipment safety analysis
-        equipment_metrics, equipment_alerts = self._analyze_equipment_safety(soldier_data)
+        equipment_metrics, equipment_alerts = self._analyze_equipment_safety(readings)
         safety_metrics.update(equipment_metrics)
         medical_alerts.extend(equipment_alerts)
         
         # Fall detection analysis
-        fall_metrics, fall_alerts = self._analyze_fall_detection(soldier_data)
+        fall_metrics, fall_alerts = self._analyze_fall_detection(readings)
         safety_metrics.update(fall_metrics)
         medical_alerts.extend(fall_alerts)
         
@@ -392,204 +477,194 @@ class SafetyAnalyzer:
             analysis_timestamp=datetime.now()
         )
     
-    def _analyze_heart_rate(self, soldier_data: pd.DataFrame) -> Tuple[Dict[str, Any], List[MedicalAlert]]:
+    def _analyze_heart_rate(self, readings: Dict[str, np.ndarray]) -> Tuple[Dict[str, Any], List[MedicalAlert]]:
         """Analyze heart rate data for safety concerns"""
         metrics = {}
         alerts = []
         
-        if 'Heart_Rate' not in soldier_data.columns:
-            return metrics, alerts
-        
-        hr_data = soldier_data['Heart_Rate'].dropna()
-        if len(hr_data) == 0:
+        hr_data = readings.get('Heart_Rate')
+        if hr_data is None or len(hr_data) == 0:
             return metrics, alerts
         
-        # Basic statistics
+        # Basic statistics, each a single reduction over the present readings
+        min_hr = hr_data.min()
+        max_hr = hr_data.max()
+        hr_std = _sample_std(hr_data)
         metrics.update({
-            'min_heart_rate': hr_data.min(),
+            'min_heart_rate': min_hr,
             'avg_heart_rate': hr_data.mean(),
-            'max_heart_rate': hr_data.max(),
-            'hr_std_deviation': hr_data.std()
+            'max_heart_rate': max_hr,
+            'hr_std_deviation': hr_std
         })
         
         # Threshold checks
-        thresholds = self.safety_config['heart_rate_thresholds']
-        max_hr = hr_data.max()
-        min_hr = hr_data.min()
+        critical_high, high, normal_high, normal_low, low, critical_low = self._hr_thresholds
         
         # High heart rate alerts
-        if max_hr >= thresholds['critical_high']:
+        if max_hr >= critical_high:
             alerts.append(MedicalAlert(
                 alert_type=MedicalAlertType.HEART_RATE_HIGH,
                 severity=SafetyRiskLevel.CRITICAL,
                 message=f"CARDIAC EMERGENCY: Heart rate {max_hr:.0f} BPM exceeds critical threshold",
                 value=max_hr,
-                threshold=thresholds['critical_high'],
+                threshold=critical_high,
                 requires_immediate_action=True
             ))
-        elif max_hr >= thresholds['high']:
+        elif max_hr >= high:
             alerts.append(MedicalAlert(
                 alert_type=MedicalAlertType.HEART_RATE_HIGH,
                 severity=SafetyRiskLevel.HIGH,
                 message=f"Elevated heart rate detected: {max_hr:.0f} BPM",
                 value=max_hr,
-                threshold=thresholds['high']
+                threshold=high
             ))
         
         # Low heart rate alerts
-        if min_hr <= thresholds['critical_low']:
+        if min_hr <= critical_low:
             alerts.append(MedicalAlert(
                 alert_type=MedicalAlertType.HEART_RATE_LOW,
                 severity=SafetyRiskLevel.CRITICAL,
                 message=f"CARDIAC EMERGENCY: Heart rate {min_hr:.0f} BPM below critical threshold",
                 value=min_hr,
-                threshold=thresholds['critical_low'],
+                threshold=critical_low,
                 requires_immediate_action=True
             ))
-        elif min_hr <= thresholds['low']:
+        elif min_hr <= low:
             alerts.append(MedicalAlert(
                 alert_type=MedicalAlertType.HEART_RATE_LOW,
                 severity=SafetyRiskLevel.HIGH,
                 message=f"Bradycardia detected: {min_hr:.0f} BPM",
                 value=min_hr,
-                threshold=thresholds['low']
+                threshold=low
             ))
         
         # Additional analysis
-        metrics['hr_variability'] = hr_data.std()
-        metrics['hr_above_normal'] = len(hr_data[hr_data > thresholds['normal_high']])
-        metrics['hr_below_normal'] = len(hr_data[hr_data < thresholds['normal_low']])
+        metrics['hr_variability'] = hr_std
+        metrics['hr_above_normal'] = int(np.count_nonzero(hr_data > normal_high))
+        metrics['hr_below_normal'] = int(np.count_nonzero(hr_data < normal_low))
         
         return metrics, alerts
     
-    def _analyze_temperature(self, soldier_data: pd.DataFrame) -> Tuple[Dict[str, Any], List[MedicalAlert]]:
+    def _analyze_temperature(self, readings: Dict[str, np.ndarray]) -> Tuple[Dict[str, Any], List[MedicalAlert]]:
         """Analyze temperature data for safety concerns"""
         metrics = {}
         alerts = []
         
-        if 'Temperature' not in soldier_data.columns:
-            return metrics, alerts
-        
-        temp_data = soldier_data['Temperature'].dropna()
-        if len(temp_data) == 0:
+        temp_data = readings.get('Temperature')
+        if temp_data is None or len(temp_data) == 0:
             return metrics, alerts
         
         # Basic statistics
+        min_temp = temp_data.min()
+        max_temp = temp_data.max()
         metrics.update({
-            'min_temperature': temp_data.min(),
+            'min_temperature': min_temp,
             'avg_temperature': temp_data.mean(),
-            'max_temperature': temp_data.max(),
-            'temp_std_deviation': temp_data.std()
+            'max_temperature': max_temp,
+            'temp_std_deviation': _sample_std(temp_data)
         })
         
         # Threshold checks
-        thresholds = self.safety_config['temperature_thresholds']
-        max_temp = temp_data.max()
-        min_temp = temp_data.min()
+        critical_high, high, _, _, low, critical_low = self._temp_thresholds
         
         # High temperature alerts
-        if max_temp >= thresholds['critical_high']:
+        if max_temp >= critical_high:
             alerts.append(MedicalAlert(
                 alert_type=MedicalAlertType.TEMPERATURE_HIGH,
                 severity=SafetyRiskLevel.CRITICAL,
                 message=f"HEAT EMERGENCY: Temperature {max_temp:.1f}°F - Immediate cooling required",
                 value=max_temp,
-                threshold=thresholds['critical_high'],
+                threshold=critical_high,
                 requires_immediate_action=True
             ))
-        elif max_temp >= thresholds['high']:
+        elif max_temp >= high:
             alerts.append(MedicalAlert(
                 alert_type=MedicalAlertType.TEMPERATURE_HIGH,
                 severity=SafetyRiskLevel.HIGH,
                 message=f"Heat stress detected: {max_temp:.1f}°F",
                 value=max_temp,
-                threshold=thresholds['high']
+                threshold=high
             ))
         
         # Low temperature alerts
-        if min_temp <= thresholds['critical_low']:
+        if min_temp <= critical_low:
             alerts.append(MedicalAlert(
                 alert_type=MedicalAlertType.TEMPERATURE_LOW,
                 severity=SafetyRiskLevel.CRITICAL,
                 message=f"HYPOTHERMIA EMERGENCY: Temperature {min_temp:.1f}°F",
                 value=min_temp,
-                threshold=thresholds['critical_low'],
+                threshold=critical_low,
                 requires_immediate_action=True
             ))
-        elif min_temp <= thresholds['low']:
+        elif min_temp <= low:
             alerts.append(MedicalAlert(
                 alert_type=MedicalAlertType.TEMPERATURE_LOW,
                 severity=SafetyRiskLevel.HIGH,
                 message=f"Cold stress detected: {min_temp:.1f}°F",
                 value=min_temp,
-                threshold=thresholds['low']
+                threshold=low
             ))
         
         return metrics, alerts
     
-    def _analyze_equipment_safety(self, soldier_data: pd.DataFrame) -> Tuple[Dict[str, Any], List[MedicalAlert]]:
+    def _analyze_equipment_safety(self, readings: Dict[str, np.ndarray]) -> Tuple[Dict[str, Any], List[MedicalAlert]]:
         """Analyze equipment status for safety implications"""
         metrics = {}
         alerts = []
         
+        battery_critical, _, signal_poor = self._equipment_thresholds
+        
         # Battery analysis
-        if 'Battery' in soldier_data.columns:
-            battery_data = soldier_data['Battery'].dropna()
-            if len(battery_data) > 0:
-                min_battery = battery_data.min()
-                avg_battery = battery_data.mean()
-                
-                metrics.update({
-                    'min_battery': min_battery,
-                    'avg_battery': avg_battery,
-                    'battery_critical_incidents': len(battery_data[battery_data < 10])
-                })
-                
-                thresholds = self.safety_config['equipment_thresholds']
-                
-                if min_battery <= thresholds['battery_critical']:
-                    alerts.append(MedicalAlert(
-                        alert_type=MedicalAlertType.EQUIPMENT_FAILURE,
-                        severity=SafetyRiskLevel.HIGH,
-                        message=f"Critical equipment failure risk - Battery: {min_battery}%",
-                        value=min_battery,
-                        threshold=thresholds['battery_critical']
-                    ))
+        battery_data = readings.get('Battery')
+        if battery_data is not None and len(battery_data) > 0:
+            min_battery = battery_data.min()
+            avg_battery = battery_data.mean()
+            
+            metrics.update({
+                'min_battery': min_battery,
+                'avg_battery': avg_battery,
+                'battery_critical_incidents': int(np.count_nonzero(battery_data < 10))
+            })
+            
+            if min_battery <= battery_critical:
+                alerts.append(MedicalAlert(
+                    alert_type=MedicalAlertType.EQUIPMENT_FAILURE,
+                    severity=SafetyRiskLevel.HIGH,
+                    message=f"Critical equipment failure risk - Battery: {min_battery}%",
+                    value=min_battery,
+                    threshold=battery_critical
+                ))
         
         # Communication signal analysis
-        if 'RSSI' in soldier_data.columns:
-            rssi_data = soldier_data['RSSI'].dropna()
-            if len(rssi_data) > 0:
-                min_rssi = rssi_data.min()
-                avg_rssi = rssi_data.mean()
-                
-                metrics.update({
-                    'min_rssi': min_rssi,
-                    'avg_rssi': avg_rssi,
-                    'signal_quality': 'Good' if avg_rssi > -70 else 'Poor'
-                })
-                
-                if min_rssi < self.safety_config['equipment_thresholds']['signal_poor']:
-                    alerts.append(MedicalAlert(
-                        alert_type=MedicalAlertType.EQUIPMENT_FAILURE,
-                        severity=SafetyRiskLevel.MODERATE,
-                        message=f"Communication failure risk - Signal: {min_rssi} dBm",
-                        value=min_rssi,
-                        threshold=self.safety_config['equipment_thresholds']['signal_poor']
-                    ))
+        rssi_data = readings.get('RSSI')
+        if rssi_data is not None and len(rssi_data) > 0:
+            min_rssi = rssi_data.min()
+            avg_rssi = rssi_data.mean()
+            
+            metrics.update({
+                'min_rssi': min_rssi,
+                'avg_rssi': avg_rssi,
+                'signal_quality': 'Good' if avg_rssi > -70 else 'Poor'
+            })
+            
+            if min_rssi < signal_poor:
+                alerts.append(MedicalAlert(
+                    alert_type=MedicalAlertType.EQUIPMENT_FAILURE,
+                    severity=SafetyRiskLevel.MODERATE,
+                    message=f"Communication failure risk - Signal: {min_rssi} dBm",
+                    value=min_rssi,
+                    threshold=signal_poor
+                ))
         
         return metrics, alerts
     
-    def _analyze_fall_detection(self, soldier_data: pd.DataFrame) -> Tuple[Dict[str, Any], List[MedicalAlert]]:
+    def _analyze_fall_detection(self, readings: Dict[str, np.ndarray]) -> Tuple[Dict[str, Any], List[MedicalAlert]]:
         """Analyze fall detection data"""
         metrics = {}
         alerts = []
         
-        if 'Fall_Detection' not in soldier_data.columns:
-            return metrics, alerts
-        
-        fall_data = soldier_data['Fall_Detection'].dropna()
-        if len(fall_data) == 0:
+        fall_data = readings.get('Fall_Detection')
+        if fall_data is None or len(fall_data) == 0:
             return metrics, alerts
         
         total_falls = fall_data.sum()
@@ -614,30 +689,30 @@ class SafetyAnalyzer:
         # Heart rate check
         if 'heart_rate' in data:
             hr = data['heart_rate']
-            thresholds = self.safety_config['heart_rate_thresholds']
+            critical_high, _, _, _, _, critical_low = self._hr_thresholds
             
-            if hr >= thresholds['critical_high'] or hr <= thresholds['critical_low']:
+            if hr >= critical_high or hr <= critical_low:
                 alerts.append(MedicalAlert(
-                    alert_type=MedicalAlertType.HEART_RATE_HIGH if hr >= thresholds['critical_high'] else MedicalAlertType.HEART_RATE_LOW,
+                    alert_type=MedicalAlertType.HEART_RATE_HIGH if hr >= critical_high else MedicalAlertType.HEART_RATE_LOW,
                     severity=SafetyRiskLevel.CRITICAL,
                     message=f"IMMEDIATE CARDIAC ALERT: Heart rate {hr:.0f} BPM",
                     value=hr,
-                    threshold=thresholds['critical_high'] if hr >= thresholds['critical_high'] else thresholds['critical_low'],
+                    threshold=critical_high if hr >= critical_high else critical_low,
                     requires_immediate_action=True
                 ))
         
         # Temperature check
         if 'temperature' in data:
             temp = data['temperature']
-            thresholds = self.safety_config['temperature_thresholds']
+            critical_high, _, _, _, _, critical_low = self._temp_thresholds
             
-            if temp >= thresholds['critical_high'] or temp <= thresholds['critical_low']:
+            if temp >= critical_high or temp <= critical_low:
                 alerts.append(MedicalAlert(
-                    alert_type=MedicalAlertType.TEMPERATURE_HIGH if temp >= thresholds['critical_high'] else MedicalAlertType.TEMPERATURE_LOW,
+                    alert_type=MedicalAlertType.TEMPERATURE_HIGH if temp >= critical_high else MedicalAlertType.TEMPERATURE_LOW,
                     severity=SafetyRiskLevel.CRITICAL,
                     message=f"IMMEDIATE TEMPERATURE ALERT: {temp:.1f}°F",
                     value=temp,
-                    threshold=thresholds['critical_high'] if temp >= thresholds['critical_high'] else thresholds['critical_low'],
+                    threshold=critical_high if temp >= critical_high else critical_low,
                     requires_immediate_action=True
                 ))
         
@@ -654,30 +729,67 @@ class SafetyAnalyzer:
         
         return alerts
     
+    def _scan_thresholds(self, heart_rate: np.ndarray, temperature: np.ndarray,
+                         fall_detected: np.ndarray) -> np.ndarray:
+        """
+        Screen many real-time readings against the critical thresholds at once
+        
+        Missing readings are NaN and never fire. Returns an int8 array of
+        ALERT_FLAG_* bits, one entry per reading.
+        """
+        hr_critical_high, _, _, _, _, hr_critical_low = self._hr_thresholds
+        temp_critical_high, _, _, _, _, temp_critical_low = self._temp_thresholds
+        
+        flags = np.zeros(len(heart_rate), dtype=np.int8)
+        flags[heart_rate >= hr_critical_high] |= ALERT_FLAG_HR_HIGH
+        flags[heart_rate <= hr_critical_low] |= ALERT_FLAG_HR_LOW
+        flags[temperature >= temp_critical_high] |= ALERT_FLAG_TEMP_HIGH
+        flags[temperature <= temp_critical_low] |= ALERT_FLAG_TEMP_LOW
+        flags[fall_detected] |= ALERT_FLAG_FALL
+        return flags
+    
+    def check_immediate_safety_alerts_batch(self, readings: List[Dict[str, Any]]) -> List[List[MedicalAlert]]:
+        """
+        Check a batch of real-time readings for immediate safety alerts
+        
+        The thresholds are screened for the whole batch in one vectorized pass;
+        alert objects are only built for readings that raised a flag.
+        
+        Args:
+            readings: Real-time data dicts as accepted by _check_immediate_safety_alerts
+            
+        Returns:
+            The alerts for each reading, in input order
+        """
+        heart_rate = np.array([reading.get('heart_rate', np.nan) for reading in readings], dtype=np.float64)
+        temperature = np.array([reading.get('temperature', np.nan) for reading in readings], dtype=np.float64)
+        fall_detected = np.array([bool(reading.get('fall_detected', False)) for reading in readings], dtype=bool)
+        
+        flags = self._scan_thresholds(heart_rate, temperature, fall_detected)
+        
+        alerts: List[List[MedicalAlert]] = [[] for _ in readings]
+        for index in np.flatnonzero(flags):
+            alerts[index] = self._check_immediate_safety_alerts(readings[index])
+        return alerts
+    
     def _calculate_safety_score(self, alerts: List[MedicalAlert], base_score: int) -> int:
         """Calculate overall safety score based on alerts"""
-        score = base_score
         scoring = self.safety_config['safety_scoring']
+        penalties = {
+            SafetyRiskLevel.CRITICAL: scoring['critical_alert_penalty'],
+            SafetyRiskLevel.HIGH: scoring['high_alert_penalty'],
+            SafetyRiskLevel.MODERATE: scoring['moderate_alert_penalty']
+        }
         
-        for alert in alerts:
-            if alert.severity == SafetyRiskLevel.CRITICAL:
-                score -= scoring['critical_alert_penalty']
-            elif alert.severity == SafetyRiskLevel.HIGH:
-                score -= scoring['high_alert_penalty']
-            elif alert.severity == SafetyRiskLevel.MODERATE:
-                score -= scoring['moderate_alert_penalty']
-        
+        score = base_score - sum(penalties.get(alert.severity, 0) for alert in alerts)
         return max(0, min(100, score))
     
     def _determine_risk_level(self, alerts: List[MedicalAlert], safety_score: int) -> SafetyRiskLevel:
         """Determine overall risk level"""
-        # Check for critical alerts
-        if any(alert.severity == SafetyRiskLevel.CRITICAL for alert in alerts):
-            return SafetyRiskLevel.CRITICAL
-        
-        # Check for high severity alerts
-        if any(alert.severity == SafetyRiskLevel.HIGH for alert in alerts):
-            return SafetyRiskLevel.HIGH
+        # The most severe alert decides when it is high or critical
+        worst = max((alert.severity for alert in alerts), key=_SEVERITY_RANK.__getitem__, default=None)
+        if worst is SafetyRiskLevel.CRITICAL or worst is SafetyRiskLevel.HIGH:
+            return worst
         
         # Based on safety score
         if safety_score < 70:
@@ -729,7 +841,12 @@ class SafetyAnalyzer:
         """Apply custom safety thresholds for specific analysis"""
         for threshold_category in ['heart_rate_thresholds', 'temperature_thresholds', 'equipment_thresholds']:
             if threshold_category in custom_thresholds:
-                self.safety_config[threshold_category].update(custom_thresholds[threshold_category])
+                # Replace the section rather than update it, so the caller's saved copy
+                # of safety_config still holds the original thresholds to restore
+                self.safety_config[threshold_category] = {
+                    **self.safety_config[threshold_category], **custom_thresholds[threshold_category]
+                }
+        self._rebuild_threshold_cache()
     
     def _publish_safety_analysis_success(self, result: SafetyAnalysisResult) -> None:
         """Publish safety analysis success event"""
@@ -840,6 +957,7 @@ class SafetyAnalyzer:
                 # Restore original configuration
                 if original_config:
                     self.safety_config = original_config
+                    self._rebuild_threshold_cache()
                     
         except Exception as e:
             return SafetyAnalysisResult(
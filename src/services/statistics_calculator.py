@@ -1,46 +1,152 @@
 """Statistics calculation service for soldier data analysis"""
 
+import hashlib
+from collections import OrderedDict
+from dataclasses import replace
+
 import numpy as np
 import pandas as pd
 from typing import List, Dict, Any, Optional, Union
 from src.models.analysis_results import StatisticalSummary
 
+# Heart rate zone lower bounds (inclusive) and names, in ascending order
+HR_ZONE_BINS = [-np.inf, 60, 100, 150, 180, 190, np.inf]
+HR_ZONE_NAMES = ['rest', 'normal', 'elevated', 'high', 'extreme', 'critical']
+
+# Number of array summaries remembered between analysis runs
+SUMMARY_CACHE_SIZE = 256
+
+
 class StatisticsCalculator:
     """Service for calculating statistical summaries and metrics"""
     
     def __init__(self):
         self.name = "StatisticsCalculator"
+        self._summary_cache: OrderedDict[bytes, StatisticalSummary] = OrderedDict()
     
-    def calculate_summary(self, values: List[Union[int, float]]) -> StatisticalSummary:
-        """Calculate statistical summary from list of values"""
+    def calculate_summary(self, values: Union[List[Union[int, float]], np.ndarray]) -> StatisticalSummary:
+        """Calculate statistical summary from a list or NumPy array of values"""
+        if isinstance(values, np.ndarray):
+            return self._cached_array_summary(values)
         return StatisticalSummary.from_values(values)
     
-    def calculate_heart_rate_zones(self, heart_rates: List[float]) -> Dict[str, int]:
-        """Calculate heart rate zone distribution"""
-        zones = {
-            'rest': 0,        # < 60 BPM
-            'normal': 0,      # 60-100 BPM
-            'elevated': 0,    # 100-150 BPM
-            'high': 0,        # 150-180 BPM
-            'extreme': 0,     # 180-190 BPM
-            'critical': 0     # > 190 BPM
-        }
+    def clear_cache(self) -> None:
+        """Forget remembered array summaries (e.g. when a new dataset is loaded)"""
+        self._summary_cache.clear()
+    
+    def _cached_array_summary(self, values: np.ndarray) -> StatisticalSummary:
+        """Summarize an array, reusing the result for identical contents"""
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        # Hashing the buffer is linear; the percentiles it saves need a partial sort
+        key = hashlib.blake2b(memoryview(values), digest_size=16).digest()
+        
+        summary = self._summary_cache.get(key)
+        if summary is None:
+            summary = self._summarize_array(values)
+            self._summary_cache[key] = summary
+            if len(self._summary_cache) > SUMMARY_CACHE_SIZE:
+                self._summary_cache.popitem(last=False)
+        else:
+            self._summary_cache.move_to_end(key)
+        
+        return replace(summary)
+    
+    def _summarize_array(self, values: np.ndarray) -> StatisticalSummary:
+        """Calculate statistical summary directly from a NumPy array, ignoring NaNs"""
+        values = np.asarray(values, dtype=np.float64)
+        null_mask = np.isnan(values)
+        null_count = int(null_mask.sum())
+        if null_count:
+            values = values[~null_mask]
         
-        for hr in heart_rates:
-            if hr < 60:
-                zones['rest'] += 1
-            elif hr < 100:
-                zones['normal'] += 1
-            elif hr < 150:
-                zones['elevated'] += 1
-            elif hr < 180:
-                zones['high'] += 1
-            elif hr < 190:
-                zones['extreme'] += 1
-            else:
-                zones['critical'] += 1
-        
-        return zones
+        if not values.size:
+            return StatisticalSummary(
+                count=0, mean=0, median=0, std_dev=0,
+                min_value=0, max_value=0, percentile_25=0, percentile_75=0,
+                null_count=null_count
+            )
+        
+        p25, median, p75 = np.percentile(values, [25, 50, 75])
+        return StatisticalSummary(
+            count=int(values.size),
+            mean=float(values.mean()),
+            median=float(median),
+            std_dev=float(values.std()),
+            min_value=float(values.min()),
+            max_value=float(values.max()),
+            percentile_25=float(p25),
+            percentile_75=float(p75),
+            null_count=null_count
+        )
+    
+    def calculate_grouped_summaries(self, grouped_values) -> Dict[Any, StatisticalSummary]:
+        """
+        Calculate statistical summaries for every group of a grouped Series.
+        
+        All groups are aggregated in one vectorized pass; groups without any
+        non-null values are omitted from the result.
+        """
+        aggregated = grouped_values.agg(['count', 'mean', 'min', 'max'])
+        if aggregated.empty:
+            return {}
+        
+        std_dev = grouped_values.std(ddof=0)
+        quantiles = grouped_values.quantile([0.25, 0.5, 0.75]).unstack()
+        
+        summaries = {}
+        for key, count, mean, min_value, max_value, std, p25, median, p75 in zip(
+            aggregated.index,
+            aggregated['count'].to_numpy(),
+            aggregated['mean'].to_numpy(),
+            aggregated['min'].to_numpy(),
+            aggregated['max'].to_numpy(),
+            std_dev.reindex(aggregated.index).to_numpy(),
+            quantiles[0.25].reindex(aggregated.index).to_numpy(),
+            quantiles[0.5].reindex(aggregated.index).to_numpy(),
+            quantiles[0.75].reindex(aggregated.index).to_numpy()
+        ):
+            if count == 0:
+                continue
+            summaries[key] = StatisticalSummary(
+                count=int(count),
+                mean=float(mean),
+                median=float(median),
+                std_dev=float(std),
+                min_value=float(min_value),
+                max_value=float(max_value),
+                percentile_25=float(p25),
+                percentile_75=float(p75)
+            )
+        
+        return summaries
+    
+    def calculate_grouped_heart_rate_zones(
+        self,
+        heart_rates: pd.Series,
+        keys: pd.Series
+    ) -> Dict[Any, Dict[str, int]]:
+        """Calculate heart rate zone distribution for every group in one pass"""
+        zone = pd.cut(heart_rates, bins=HR_ZONE_BINS, labels=HR_ZONE_NAMES, right=False)
+        counts = (
+            pd.DataFrame({'key': keys, 'zone': zone})
+            .groupby(['key', 'zone'], sort=False, observed=True)
+            .size()
+            .unstack(fill_value=0)
+            .reindex(columns=HR_ZONE_NAMES, fill_value=0)
+        )
+        return {
+            key: dict(zip(HR_ZONE_NAMES, row.tolist()))
+            for key, row in zip(counts.index, counts.to_numpy())
+        }
+    
+    def calculate_heart_rate_zones(self, heart_rates: Union[List[float], np.ndarray]) -> Dict[str, int]:
+        """Calculate heart rate zone distribution"""
+        # Zone index = number of inner bin edges <= hr; NaN sorts last and lands in 'critical'
+        zone_index = np.searchsorted(
+            HR_ZONE_BINS[1:-1], np.asarray(heart_rates, dtype=np.float64), side='right'
+        )
+        counts = np.bincount(zone_index.ravel(), minlength=len(HR_ZONE_NAMES))
+        return dict(zip(HR_ZONE_NAMES, counts.tolist()))
     
     def calculate_percentiles(self, values: List[float], percentiles: List[float] = None) -> Dict[str, float]:
         """Calculate percentiles for a list of values"""
@@ -26,7 +26,7 @@ def event_bus():
 
 @pytest.fixture
 def test_settings():
-    return Settings(
+    settings = Settings(
         column_mapping={
             'callsign': 'Callsign',
             'squad': 'Platoon',
@@ -49,6 +49,9 @@ def test_settings():
             'battery_thresholds': {'critical': 10, 'low': 20}
         }
     )
+    # Keep tests from persisting Parquet copies in the developer's ~/.cache/aar
+    settings.data_processing.parquet_cache_directory = None
+    return settings
 
 @pytest.fixture
 def sample_soldier_data():
@@ -0,0 +1,55 @@
+# File: tests/unit/test_analysis_engine.py
+"""Unit tests for the analysis engine"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from unittest.mock import Mock
+
+from src.models.soldier_data import SoldierDataset, DatasetMetadata, SoldierRunningStats, RunningStatistics
+from src.services.analysis_engine import AnalysisEngine
+
+
+class TestAnalysisEngine:
+    """Test the AnalysisEngine service"""
+    
+    def test_precomputed_statistics_match_frame_analysis(self):
+        """Test that a streamed dataset's statistics give the same results as analyzing the frame"""
+        frame = pd.DataFrame({
+            'Callsign': ['ALPHA1', 'ALPHA1', 'ALPHA1', 'BRAVO2'],
+            'HR': [70.0, 185.0, np.nan, 95.0],
+            'Step_Count': [10.0, 20.0, 30.0, 40.0]
+        })
+        engine = AnalysisEngine(Mock())
+        precomputed = {}
+        for callsign, rows in frame.groupby('Callsign'):
+            soldier_stats = SoldierRunningStats(record_count=len(rows))
+            for column in ('HR', 'Step_Count'):
+                values = rows[column].dropna().to_numpy()
+                # Fold one reading at a time, as if every row arrived in its own chunk
+                running = soldier_stats.metrics[column] = RunningStatistics()
+                for value in values:
+                    running.merge(1, value, 0.0, value, value, value)
+            soldier_stats.heart_rate_zones = engine.stats_calculator.calculate_heart_rate_zones(
+                rows['HR'].dropna().to_numpy()
+            )
+            precomputed[callsign] = soldier_stats
+        
+        metadata = DatasetMetadata(file_path=Path("stream.csv"), original_filename="stream.csv", file_size_bytes=0)
+        
+        expected = engine.analyze_dataset(SoldierDataset(raw_dataframe=frame, metadata=metadata)).soldier_results
+        streamed = engine.analyze_dataset(SoldierDataset(
+            raw_dataframe=frame.iloc[:0], metadata=metadata, precomputed_statistics=precomputed
+        )).soldier_results
+        
+        assert set(streamed) == set(expected) == {'ALPHA1', 'BRAVO2'}
+        for callsign, result in expected.items():
+            hr_expected = result.heart_rate_analysis.statistics
+            hr_streamed = streamed[callsign].heart_rate_analysis.statistics
+            assert streamed[callsign].total_records == result.total_records
+            assert hr_streamed.mean == pytest.approx(hr_expected.mean)
+            assert hr_streamed.std_dev == pytest.approx(hr_expected.std_dev)
+            assert hr_streamed.max_value == hr_expected.max_value
+            assert streamed[callsign].heart_rate_analysis.zones == result.heart_rate_analysis.zones
+            assert streamed[callsign].physical_performance.total_steps == result.physical_performance.total_steps
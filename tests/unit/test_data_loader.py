@@ -2,6 +2,7 @@
 """Unit tests for the data loader service"""
 
 import pytest
+import numpy as np
 import pandas as pd
 from unittest.mock import Mock, patch
 import tempfile
@@ -119,7 +120,7 @@ class TestDataLoader:
         dataset = loader.load_data(str(csv_path))
         
         # Verify cleaning
-        assert dataset.data['Heart_Rate'].dtype in ['int64', 'float64']
+        assert dataset.data['Heart_Rate'].dtype in ['int64', 'float32', 'float64']
         assert dataset.data['Fall_Detection'].tolist() == [0, 1]
         assert pd.api.types.is_datetime64_any_dtype(dataset.data['Time_Step'])
     
@@ -167,4 +168,90 @@ class TestDataLoader:
         loaded_event = data_loaded_events[0]
         assert loaded_event.type == EventType.DATA_LOADED.value
         assert 'dataset' in loaded_event.data
-        assert loaded_event.data['file_path'] == str(csv_path)
\ No newline at end of file
+        assert loaded_event.data['file_path'] == str(csv_path)
+    
+    def test_repeat_load_uses_cache(self, event_bus, test_settings, sample_soldier_data, tmp_path):
+        """Test that reloading an unchanged file returns the cached dataset"""
+        csv_path = tmp_path / "cache_test.csv"
+        sample_soldier_data.to_csv(csv_path, index=False)
+        
+        loader = DataLoader(event_bus, test_settings)
+        first = loader.load_data(str(csv_path))
+        
+        assert loader.is_cached(str(csv_path))
+        assert loader.load_data(str(csv_path)) is first
+        
+        # Modifying the file invalidates the cached entry
+        sample_soldier_data.head(10).to_csv(csv_path, index=False)
+        reloaded = loader.load_data(str(csv_path))
+        
+        assert reloaded is not first
+        assert len(reloaded.raw_dataframe) == 10
+    
+    def test_parquet_cache_invalidated_by_column_mapping(self, event_bus, test_settings, tmp_path):
+        """Test that changing the column mapping does not reuse a persisted Parquet copy"""
+        pytest.importorskip("pyarrow")
+        csv_path = tmp_path / "parquet_test.csv"
+        pd.DataFrame({
+            'callsign': ['ALPHA1', 'BRAVO2'],
+            'heartrate': [75, 80]
+        }).to_csv(csv_path, index=False)
+        test_settings.data_processing.parquet_cache_directory = str(tmp_path / "cache")
+        
+        first = DataLoader(event_bus, test_settings).load_data(str(csv_path))
+        assert 'Heart_Rate' in first.raw_dataframe.columns
+        assert list((tmp_path / "cache").glob("*.parquet"))
+        
+        # A new loader with a different mapping must rebuild the frame from the CSV
+        test_settings.column_mapping = {**test_settings.column_mapping, 'heartrate': 'HR'}
+        remapped = DataLoader(event_bus, test_settings).load_data(str(csv_path))
+        
+        assert 'HR' in remapped.raw_dataframe.columns
+        assert 'Heart_Rate' not in remapped.raw_dataframe.columns
+    
+    def test_parquet_cache_prunes_stale_entries(self, event_bus, test_settings, tmp_path):
+        """Test that rewriting a CSV replaces its persisted Parquet copy instead of adding one"""
+        pytest.importorskip("pyarrow")
+        csv_path = tmp_path / "prune_test.csv"
+        other_path = tmp_path / "other.csv"
+        pd.DataFrame({'callsign': ['ALPHA1'], 'heartrate': [75]}).to_csv(csv_path, index=False)
+        pd.DataFrame({'callsign': ['BRAVO2'], 'heartrate': [80]}).to_csv(other_path, index=False)
+        cache_dir = tmp_path / "cache"
+        test_settings.data_processing.parquet_cache_directory = str(cache_dir)
+        
+        DataLoader(event_bus, test_settings).load_data(str(other_path))
+        DataLoader(event_bus, test_settings).load_data(str(csv_path))
+        pd.DataFrame({'callsign': ['ALPHA1', 'ALPHA1'], 'heartrate': [75, 90]}).to_csv(csv_path, index=False)
+        reloaded = DataLoader(event_bus, test_settings).load_data(str(csv_path))
+        
+        assert len(reloaded.raw_dataframe) == 2
+        # One entry per CSV file: the other file's entry is kept, the stale one is gone
+        assert len(list(cache_dir.glob("*.parquet"))) == 2
+        assert len(list(cache_dir.glob("*.json"))) == 2
+    
+    def test_large_file_streamed_into_running_statistics(self, event_bus, test_settings, tmp_path):
+        """Test that streamed loads fold chunks into per-soldier statistics matching the full frame"""
+        csv_path = tmp_path / "stream_test.csv"
+        pd.DataFrame({
+            'callsign': ['ALPHA1', 'BRAVO2', 'ALPHA1', 'BRAVO2', 'ALPHA1', 'ALPHA1', 'BRAVO2'],
+            'heartrate': [75, 80, None, 95, 140, 62, 88],
+            'stepcount': [10, 20, 30, 40, 50, 60, 70]
+        }).to_csv(csv_path, index=False)
+        test_settings.data_processing.parquet_cache_directory = None
+        test_settings.data_processing.streaming_threshold_bytes = 0
+        test_settings.data_processing.chunk_size = 2
+        
+        dataset = DataLoader(event_bus, test_settings).load_data(str(csv_path))
+        
+        assert dataset.raw_dataframe.empty
+        assert 'Callsign' in dataset.raw_dataframe.columns
+        assert dataset.metadata.total_processed_rows == 7
+        
+        alpha = dataset.precomputed_statistics['ALPHA1']
+        heart_rate = alpha.metrics['Heart_Rate']
+        assert alpha.record_count == 4
+        assert heart_rate.count == 3
+        assert heart_rate.mean == pytest.approx(np.mean([75, 140, 62]))
+        assert heart_rate.std_dev == pytest.approx(np.std([75, 140, 62]))
+        assert (heart_rate.min_value, heart_rate.max_value) == (62, 140)
+        assert dataset.precomputed_statistics['BRAVO2'].metrics['Step_Count'].total == 130
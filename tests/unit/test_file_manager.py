@@ -0,0 +1,40 @@
+# File: tests/unit/test_file_manager.py
+"""Unit tests for the service manager"""
+
+import pytest
+from unittest.mock import Mock
+
+from src.services.file_manager import ServiceManager
+
+
+class TestServiceManager:
+    """Test the ServiceManager dependency ordering"""
+    
+    def test_depth_first_startup_order(self):
+        """Test that each service directly follows its dependencies in depth-first order"""
+        manager = ServiceManager(Mock())
+        manager.register_service('loader', Mock())
+        manager.register_service('scorer', Mock(), ['loader'])
+        manager.register_service('settings', Mock())
+        manager.register_service('reports', Mock(), ['scorer', 'settings'])
+        
+        assert manager.get_startup_order(depth_first=True) == ['loader', 'scorer', 'settings', 'reports']
+        assert manager.get_startup_order() == ['loader', 'settings', 'scorer', 'reports']
+    
+    def test_depth_first_order_handles_deep_chains(self):
+        """Test that long dependency chains do not hit the recursion limit"""
+        manager = ServiceManager(Mock())
+        for index in range(1500):
+            manager.register_service(f'svc{index}', Mock(), [f'svc{index + 1}'] if index < 1499 else [])
+        
+        order = manager.get_startup_order(depth_first=True)
+        
+        assert order == [f'svc{index}' for index in reversed(range(1500))]
+    
+    def test_depth_first_order_reports_missing_dependency(self):
+        """Test that an unregistered dependency raises ValueError"""
+        manager = ServiceManager(Mock())
+        manager.register_service('reports', Mock(), ['scorer'])
+        
+        with pytest.raises(ValueError, match="Dependency 'scorer' not found"):
+            manager.get_startup_order(depth_first=True)
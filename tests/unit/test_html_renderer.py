@@ -0,0 +1,29 @@
+# File: tests/unit/test_html_renderer.py
+"""Unit tests for the HTML renderer"""
+
+import pytest
+import time
+
+from src.core.events import EventType
+from src.reporting.html_renderer import HTMLRenderer
+
+
+class TestHTMLRenderer:
+    """Test the HTMLRenderer status reporting"""
+    
+    def test_status_events_recorded_without_subscribers(self, event_bus, tmp_path):
+        """Test that status updates reach the event history even when nobody subscribes"""
+        renderer = HTMLRenderer(tmp_path, event_bus)
+        renderer._publish_status("Rendering test report")
+        
+        # The bus records events on its processing thread
+        deadline = time.monotonic() + 2.0
+        messages = []
+        while time.monotonic() < deadline and "Rendering test report" not in messages:
+            time.sleep(0.01)
+            messages = [
+                event.data.get('message') for event in event_bus.get_recent_events()
+                if event.type == EventType.STATUS_UPDATE.value
+            ]
+        
+        assert "Rendering test report" in messages
@@ -0,0 +1,99 @@
+# File: tests/unit/test_performance_scorer.py
+"""Unit tests for the performance scorer service"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from unittest.mock import Mock
+
+from src.services.performance_scorer import PerformanceScorer, classify_comm_quality
+
+
+class TestPerformanceScorer:
+    """Test the PerformanceScorer service"""
+    
+    def test_summary_levels_follow_unordered_thresholds(self):
+        """Test that summary labels match the threshold ladder when config edges are out of order"""
+        scorer = PerformanceScorer(Mock())
+        scorer.update_scoring_config({'battery_thresholds': {'low': 70}})
+        
+        # 65 is below the 'low' threshold but still reaches the fixed 'Good' level of 60
+        assert scorer.generate_scoring_summary({'avg_battery': 65})['equipment_status'] == 'Good'
+        assert scorer.generate_scoring_summary({'avg_battery': 50})['equipment_status'] == 'Low'
+        assert scorer.generate_scoring_summary({'avg_battery': float('nan')})['equipment_status'] == 'Critical'
+    
+    def test_comm_quality_rates_missing_rssi_poor(self):
+        """Test that NaN RSSI readings are rated Poor, alone or inside an array"""
+        assert classify_comm_quality(float('nan')) == 'Poor'
+        assert classify_comm_quality(-65) == 'Good'
+        assert list(classify_comm_quality(np.array([np.nan, -55.0, -80.0]))) == ['Poor', 'Excellent', 'Poor']
+    
+    def test_rescoring_sees_in_place_changes(self):
+        """Test that rescoring a frame modified in place does not reuse stale statistics"""
+        scorer = PerformanceScorer(Mock())
+        data = pd.DataFrame({'Battery': [90.0, 85.0, 80.0]})
+        
+        first = scorer.score_soldier_sync('ALPHA1', data)
+        data['Battery'] = [15.0, 10.0, 5.0]
+        second = scorer.score_soldier_sync('ALPHA1', data)
+        
+        assert first.stats['min_battery'] == 80.0
+        assert second.stats['min_battery'] == 5.0
+        assert second.performance_score < first.performance_score
+    
+    def test_reuse_stats_is_opt_in(self):
+        """Test that statistics are only reused when the caller asks for it"""
+        scorer = PerformanceScorer(Mock())
+        data = pd.DataFrame({'Battery': [90.0, 85.0, 80.0]})
+        
+        scorer.score_soldier_sync('ALPHA1', data, reuse_stats=True)
+        data.loc[2, 'Battery'] = 5.0
+        
+        assert scorer.score_soldier_sync('ALPHA1', data, reuse_stats=True).stats['min_battery'] == 80.0
+        assert scorer.score_soldier_sync('ALPHA1', data).stats['min_battery'] == 5.0
+    
+    def test_batch_scores_match_scalar_scores(self):
+        """Test that batch scoring matches calculate_performance_score, including missing values"""
+        scorer = PerformanceScorer(Mock())
+        stats = [
+            {'avg_steps': 20, 'final_status': 'WOUNDED', 'avg_battery': 10,
+             'comm_quality': 'Poor', 'combat_engagements': 3},
+            {'avg_steps': 75, 'final_status': 'KIA', 'avg_battery': 45,
+             'comm_quality': 'Excellent', 'combat_engagements': 12},
+            {'avg_steps': 150, 'final_status': 'GOOD', 'avg_battery': 95, 'comm_quality': 'Good'},
+            {'avg_steps': float('nan'), 'avg_battery': float('nan')},
+            {},
+        ]
+        safety = [
+            {'medical_alerts': ['a', 'b'], 'overall_safety_score': 75},
+            {'medical_alerts': ['a'], 'medical_alert_count': 1, 'overall_safety_score': 40},
+            {'medical_alerts': [], 'overall_safety_score': 100},
+            {'overall_safety_score': 90},
+            {},
+        ]
+        
+        expected = [scorer.calculate_performance_score(dict(s), a) for s, a in zip(stats, safety)]
+        scores = scorer.calculate_performance_scores_batch(pd.DataFrame(stats), pd.DataFrame(safety))
+        
+        assert scores.tolist() == expected
+        
+        custom = scorer._merge_config({'deductions': {'medical_alert': 20}, 'activity_thresholds': {'low': 100}})
+        expected = [scorer.calculate_performance_score(dict(s), a, custom) for s, a in zip(stats, safety)]
+        scores = scorer.calculate_performance_scores_batch(pd.DataFrame(stats), pd.DataFrame(safety), custom)
+        
+        assert scores.tolist() == expected
+    
+    def test_sensor_stats_keep_input_precision(self):
+        """Test that readings just under a threshold are counted and summaries are plain floats"""
+        scorer = PerformanceScorer(Mock())
+        data = pd.DataFrame({
+            'Battery': [19.999999999, 80.0],
+            'Heart_Rate': pd.Series([133.75699, 120.5], dtype='float32'),
+        })
+        
+        stats = scorer.calculate_comprehensive_stats('ALPHA1', data)
+        
+        assert stats['low_battery_incidents'] == 1
+        assert stats['min_battery'] == 19.999999999
+        assert type(stats['avg_battery']) is float
+        assert type(stats['max_heart_rate']) is float
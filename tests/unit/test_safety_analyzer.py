@@ -0,0 +1,37 @@
+# File: tests/unit/test_safety_analyzer.py
+"""Unit tests for the safety analyzer service"""
+
+import pytest
+from unittest.mock import Mock
+
+from src.services.safety_analyzer import SafetyAnalyzer
+
+
+class TestSafetyAnalyzer:
+    """Test the SafetyAnalyzer service"""
+    
+    def test_batch_alerts_match_single_reading_checks(self):
+        """Test that batch alert checks match _check_immediate_safety_alerts for every reading"""
+        analyzer = SafetyAnalyzer(Mock())
+        readings = [
+            {'heart_rate': 120, 'temperature': 98.6},
+            {'heart_rate': 190, 'temperature': 98.6},
+            {'heart_rate': 40},
+            {'temperature': 104.0, 'fall_detected': True},
+            {'heart_rate': 35, 'temperature': 89.0, 'fall_detected': True},
+            {'fall_detected': False},
+            {'heart_rate': float('nan'), 'temperature': float('nan')},
+            {},
+        ]
+        
+        expected = [analyzer._check_immediate_safety_alerts(reading) for reading in readings]
+        alerts = analyzer.check_immediate_safety_alerts_batch(readings)
+        
+        assert alerts == expected
+        assert [len(reading_alerts) for reading_alerts in alerts] == [0, 1, 1, 2, 3, 0, 0, 0]
+    
+    def test_batch_alerts_handle_empty_batch(self):
+        """Test that an empty batch returns no alerts"""
+        analyzer = SafetyAnalyzer(Mock())
+        
+        assert analyzer.check_immediate_safety_alerts_batch([]) == []